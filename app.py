@@ -6,6 +6,7 @@ and security cameras. Designed for property managers to visualize, track,
 and report claims and camera locations on an interactive map.
 """
 import logging
+import time
 from datetime import date
 
 import streamlit as st
@@ -21,7 +22,8 @@ from components import (
     render_list_view,
     render_statistics
 )
-from utils.geocoding import search_location
+from utils.assets import preload_assets
+from utils.geocoding import cached_search_location
 
 # --- Logging Configuration ---
 logging.basicConfig(
@@ -30,12 +32,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Minimum gap between automatic (non-button) location searches
+SEARCH_DEBOUNCE_SECONDS = 0.4
+
 # --- Page Configuration ---
 st.set_page_config(layout="wide", page_title="Boardwalk Incident Map")
 
-# --- Custom CSS ---
+# --- Custom CSS (single stylesheet, emitted once per run) ---
 st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
+# --- Static assets (read once per process, concurrently) ---
+preload_assets()
+
 
 # =============================================================================
 # Session State Initialization
@@ -62,82 +70,6 @@ if 'search_result_message' not in st.session_state:
 map_locked = render_sidebar()
 
 
-# =============================================================================
-# Main Area - Header
-# =============================================================================
-
-# Custom CSS for the rounded label boxes
-st.markdown("""
-<style>
-.label-box {
-    background-color: #000000;
-    color: #ffffff;
-    font-weight: bold;
-    padding: 0 15px;
-    border-radius: 12px;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    width: 100%;
-    text-align: center;
-    font-size: 0.9rem;
-    height: 38px;
-    margin: 0;
-    margin-top: -2px; /* Nudge up to match text input baseline */
-}
-    /* Global Font Overrides handled in config.py */
-    
-    /* Label Box Styling */
-    .label-box {
-        background-color: black;
-        color: white;
-        padding: 8px 16px;
-        border-radius: 8px;
-        font-weight: 600;
-        font-size: 14px;
-        text-align: center;
-        white-space: nowrap;
-        height: 42px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        margin-bottom: 0px; /* Removing auto-margin */
-    }
-    
-    /* Success/Error Box Styling for Horizontal Layout */
-    .status-box-success {
-        background-color: #d1e7dd;
-        color: #0f5132;
-        padding: 8px 12px;
-        border-radius: 8px;
-        border: 1px solid #badbcc;
-        font-size: 14px;
-        height: 42px;
-        display: flex;
-        align-items: center;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-    }
-    
-    .status-box-error {
-        background-color: #f8d7da;
-        color: #842029;
-        padding: 8px 12px;
-        border-radius: 8px;
-        border: 1px solid #f5c2c7;
-        font-size: 14px;
-        height: 42px;
-        display: flex;
-        align-items: center;
-        white-space: nowrap;
-        overflow: hidden;
-        text-overflow: ellipsis;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-
 # =============================================================================
 # App Header & Inputs
 # =============================================================================
@@ -145,6 +77,13 @@ st.markdown("""
 st.title("Property Claim Mapper")
 
 # Project Basics
+def _sync_header_inputs() -> None:
+    """Copy edited header inputs into project_data and refresh the report title."""
+    st.session_state.project_data['property'] = st.session_state.prop_input
+    st.session_state.project_data['year'] = st.session_state.year_input
+    st.session_state.pop('current_project_title', None)
+
+
 c1, c2, c3, c4 = st.columns([1.2, 4, 1.2, 4], vertical_alignment="center")
 
 with c1:
@@ -154,10 +93,9 @@ with c2:
         "Property Name",
         value=st.session_state.project_data['property'],
         label_visibility="collapsed",
-        key="prop_input"
+        key="prop_input",
+        on_change=_sync_header_inputs
     )
-    # Update project_data from the widget's session state key
-    st.session_state.project_data['property'] = st.session_state.prop_input
 
 with c3:
     st.markdown('<div class="label-box">Year</div>', unsafe_allow_html=True)
@@ -166,76 +104,97 @@ with c4:
         "Year",
         value=st.session_state.project_data['year'],
         label_visibility="collapsed",
-        key="year_input"
+        key="year_input",
+        on_change=_sync_header_inputs
     )
-    # Update project_data from the widget's session state key
-    st.session_state.project_data['year'] = st.session_state.year_input
 
-# For backward compatibility and PDF generation override
-st.session_state.current_project_title = f"{st.session_state.prop_input} - {st.session_state.year_input} - Incidents & Claims Map"
+# For backward compatibility and PDF generation override; only rebuilt after
+# the header inputs change or a project is created/loaded
+if 'current_project_title' not in st.session_state:
+    st.session_state.current_project_title = (
+        f"{st.session_state.prop_input} - {st.session_state.year_input} - Incidents & Claims Map"
+    )
 
 
 # =============================================================================
 # Location Search
 # =============================================================================
 
-# Define columns: Label | Input | Search Button | Result Box
-c_s_label, c_s_input, c_s_btn, c_s_result = st.columns([1.2, 3, 1, 3], vertical_alignment="center")
-
-with c_s_label:
-    st.markdown('<div class="label-box">Location</div>', unsafe_allow_html=True)
-with c_s_input:
-    search_query = st.text_input(
-        "📍 Find Location",
-        placeholder="Enter full address, e.g. 123 Main St, City, State",
-        label_visibility="collapsed"
-    )
+@st.fragment
+def _location_search_fragment():
+    """Location search row; reruns on its own unless the map has to jump."""
+    # Define columns: Label | Input | Search Button | Result Box
+    c_s_label, c_s_input, c_s_btn, c_s_result = st.columns([1.2, 3, 1, 3], vertical_alignment="center")
+
+    with c_s_label:
+        st.markdown('<div class="label-box">Location</div>', unsafe_allow_html=True)
+    with c_s_input:
+        search_query = st.text_input(
+            "📍 Find Location",
+            placeholder="Enter full address, e.g. 123 Main St, City, State",
+            label_visibility="collapsed"
+        )
 
-do_search = False
-with c_s_btn:
-    if st.button("Search", width="stretch"):
+    do_search = False
+    jump_to_result = False
+    with c_s_btn:
+        if st.button("Search", width="stretch"):
+            do_search = True
+
+    # Also trigger search on new query, unless the last search was moments
+    # ago (reruns from other widgets while typing)
+    if (
+        search_query
+        and search_query != st.session_state.get('last_search_query', '')
+        and time.monotonic() - st.session_state.get('last_search_ts', 0.0) > SEARCH_DEBOUNCE_SECONDS
+    ):
         do_search = True
 
-# Also trigger search on new query
-if search_query and search_query != st.session_state.get('last_search_query', ''):
-    do_search = True
-
-if do_search and search_query:
-    try:
-        st.session_state.last_search_query = search_query
-        with st.spinner("Searching..."):
-            result = search_location(search_query)
-        
-        if result:
-            lat, lng, address = result
-            st.session_state.search_result_status = 'success'
-            st.session_state.search_result_message = f"Found: {address}"
-            
-            # Update Map
-            st.session_state.project_data['map_config']['center'] = [lat, lng]
-            st.session_state.project_data['map_config']['zoom'] = 18
-            st.session_state._map_jump_requested = True 
-        else:
+    if do_search and search_query:
+        try:
+            st.session_state.last_search_query = search_query
+            st.session_state.last_search_ts = time.monotonic()
+            with st.spinner("Searching..."):
+                result = cached_search_location(search_query)
+
+            if result:
+                lat, lng, address = result
+                st.session_state.search_result_status = 'success'
+                st.session_state.search_result_message = f"Found: {address}"
+
+                # Update Map
+                st.session_state.project_data['map_config']['center'] = [lat, lng]
+                st.session_state.project_data['map_config']['zoom'] = 18
+                st.session_state._map_jump_requested = True
+                jump_to_result = True
+            else:
+                st.session_state.search_result_status = 'error'
+                st.session_state.search_result_message = "No matching address found."
+
+        except Exception as e:
+            logger.error(f"Search error: {e}")
             st.session_state.search_result_status = 'error'
-            st.session_state.search_result_message = "No matching address found."
-            
-    except Exception as e:
-        logger.error(f"Search error: {e}")
-        st.session_state.search_result_status = 'error'
-        st.session_state.search_result_message = "Search Error"
-
-# Render Persistent Result Box in 4th Column
-with c_s_result:
-    if st.session_state.search_result_status == 'success':
-        st.markdown(
-            f'<div class="status-box-success">✅ {st.session_state.search_result_message}</div>', 
-            unsafe_allow_html=True
-        )
-    elif st.session_state.search_result_status == 'error':
-        st.markdown(
-            f'<div class="status-box-error">❌ {st.session_state.search_result_message}</div>', 
-            unsafe_allow_html=True
-        )
+            st.session_state.search_result_message = "Search Error"
+
+    # Render Persistent Result Box in 4th Column
+    with c_s_result:
+        if st.session_state.search_result_status == 'success':
+            st.markdown(
+                f'<div class="status-box-success">✅ {st.session_state.search_result_message}</div>', 
+                unsafe_allow_html=True
+            )
+        elif st.session_state.search_result_status == 'error':
+            st.markdown(
+                f'<div class="status-box-error">❌ {st.session_state.search_result_message}</div>', 
+                unsafe_allow_html=True
+            )
+
+    # The map lives outside this fragment, so a successful search needs a full rerun
+    if jump_to_result:
+        st.rerun()
+
+
+_location_search_fragment()
 
 
 # =============================================================================
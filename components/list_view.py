@@ -1,10 +1,18 @@
 """
 List View component for the Property Claim Mapper.
 """
+from typing import List
+
 import pandas as pd
 import streamlit as st
 
 from config import INCIDENT_TYPES
+from utils.data_helpers import sync_edited_data
+from utils.incident_store import get_incident_store, mark_incidents_changed
+
+# Columns the user can edit in each table (everything else is read-only)
+INCIDENT_EDIT_COLS = ["level", "description", "compensation", "claim_filed", "premium_impact"]
+CAMERA_EDIT_COLS = ["level"]
 
 
 def render_list_view() -> None:
@@ -15,33 +23,32 @@ def render_list_view() -> None:
         "Select rows and use the delete button to remove them."
     )
     
-    all_df = pd.DataFrame(st.session_state.incidents)
-    
     col_inc_log, col_cam_log = st.columns(2)
     
+    # Each table is a fragment: ticking delete checkboxes only reruns that
+    # table, not the map and statistics tabs.
     with col_inc_log:
-        _render_incidents_table(all_df)
+        _render_incidents_table()
     
     with col_cam_log:
-        _render_cameras_table(all_df)
+        _render_cameras_table()
 
 
-def _render_incidents_table(all_df: pd.DataFrame) -> None:
+@st.fragment
+def _render_incidents_table() -> None:
     """Render the incidents data editor table."""
     st.markdown("**Incidents**")
     
+    all_df = get_incident_store().to_dataframe()
     if all_df.empty:
         st.info("No Data.")
         return
     
-    inc_df = all_df[all_df['type'] == "Incident"].copy()
-    if inc_df.empty:
+    mask = all_df['type'].values == "Incident"
+    if not mask.any():
         st.info("No Incidents.")
         return
     
-    # Add selection column for deletion
-    inc_df.insert(0, 'select', False)
-    
     col_config = {
         "select": st.column_config.CheckboxColumn(
             "🗑️",
@@ -67,10 +74,15 @@ def _render_incidents_table(all_df: pd.DataFrame) -> None:
         "select", "id", "location", "level", "description",
         "compensation", "claim_filed", "premium_impact"
     ]
-    avail_cols = [c for c in display_cols if c in inc_df.columns]
+    avail_cols = [c for c in display_cols[1:] if c in all_df.columns]
+    
+    # Only the displayed columns of the matching rows are materialized
+    source_inc = all_df.loc[mask, avail_cols]
+    # Add selection column for deletion
+    source_inc.insert(0, 'select', False)
     
     edited_inc = st.data_editor(
-        inc_df[avail_cols],
+        source_inc,
         column_config=col_config,
         hide_index=True,
         height=450,
@@ -87,49 +99,64 @@ def _render_incidents_table(all_df: pd.DataFrame) -> None:
                 key="delete_inc_btn",
                 type="primary"
             ):
+                drop_ids = {str(x) for x in selected_inc_ids}
                 st.session_state.incidents = [
                     inc for inc in st.session_state.incidents
-                    if str(inc['id']) not in [str(x) for x in selected_inc_ids]
+                    if str(inc['id']) not in drop_ids
                 ]
+                mark_incidents_changed()
                 st.rerun()
         
-        # Sync changes back to session state
-        _sync_incident_changes(edited_inc)
+        # Sync changes back to session state; other tabs need a full rerun
+        if _sync_incident_changes(edited_inc, source_inc):
+            st.rerun()
 
 
-def _sync_incident_changes(edited_df: pd.DataFrame) -> None:
-    """Sync edited incident data back to session state."""
+def _sync_incident_changes(edited_df: pd.DataFrame, source_df: pd.DataFrame) -> bool:
+    """Sync edited incident data back to session state. Returns True if anything changed."""
     if edited_df is None:
-        return
+        return False
     
-    incident_map = {str(x['id']): i for i, x in enumerate(st.session_state.incidents)}
+    changed = _changed_rows(edited_df, source_df, INCIDENT_EDIT_COLS)
+    if changed.empty:
+        return False
     
-    for _, row in edited_df.iterrows():
-        idx = incident_map.get(str(row['id']))
-        if idx is not None:
-            st.session_state.incidents[idx]['level'] = row['level']
-            st.session_state.incidents[idx]['description'] = row['description']
-            st.session_state.incidents[idx]['compensation'] = float(row['compensation'])
-            st.session_state.incidents[idx]['claim_filed'] = bool(row['claim_filed'])
-            st.session_state.incidents[idx]['premium_impact'] = bool(row['premium_impact'])
+    sync_edited_data(changed, st.session_state.incidents, INCIDENT_EDIT_COLS)
+    mark_incidents_changed()
+    return True
 
 
-def _render_cameras_table(all_df: pd.DataFrame) -> None:
+def _changed_rows(
+    edited_df: pd.DataFrame,
+    source_df: pd.DataFrame,
+    columns: List[str]
+) -> pd.DataFrame:
+    """Return the rows of edited_df whose editable columns differ from source_df."""
+    cols = [c for c in columns if c in edited_df.columns and c in source_df.columns]
+    if not cols:
+        return edited_df.iloc[0:0]
+    
+    after = edited_df[cols]
+    before = source_df[cols].reindex(edited_df.index)
+    differs = after.ne(before) & ~(after.isna() & before.isna())
+    return edited_df[differs.any(axis=1).to_numpy()]
+
+
+@st.fragment
+def _render_cameras_table() -> None:
     """Render the cameras data editor table."""
     st.markdown("**Cameras**")
     
+    all_df = get_incident_store().to_dataframe()
     if all_df.empty:
         st.info("No Data.")
         return
     
-    cam_df = all_df[all_df['type'] == "Camera"].copy()
-    if cam_df.empty:
+    mask = all_df['type'].values == "Camera"
+    if not mask.any():
         st.info("No Cameras.")
         return
     
-    # Add selection column for deletion
-    cam_df.insert(0, 'select', False)
-    
     col_config_cam = {
         "select": st.column_config.CheckboxColumn(
             "🗑️",
@@ -145,10 +172,15 @@ def _render_cameras_table(all_df: pd.DataFrame) -> None:
     }
     
     display_cols = ["select", "id", "location", "level"]
-    avail_cols_cam = [c for c in display_cols if c in cam_df.columns]
+    avail_cols_cam = [c for c in display_cols[1:] if c in all_df.columns]
+    
+    # Only the displayed columns of the matching rows are materialized
+    source_cam = all_df.loc[mask, avail_cols_cam]
+    # Add selection column for deletion
+    source_cam.insert(0, 'select', False)
     
     edited_cam = st.data_editor(
-        cam_df[avail_cols_cam],
+        source_cam,
         column_config=col_config_cam,
         hide_index=True,
         height=450,
@@ -165,24 +197,28 @@ def _render_cameras_table(all_df: pd.DataFrame) -> None:
                 key="delete_cam_btn",
                 type="primary"
             ):
+                drop_ids = {str(x) for x in selected_cam_ids}
                 st.session_state.incidents = [
                     inc for inc in st.session_state.incidents
-                    if str(inc['id']) not in [str(x) for x in selected_cam_ids]
+                    if str(inc['id']) not in drop_ids
                 ]
+                mark_incidents_changed()
                 st.rerun()
         
-        # Sync changes back to session state
-        _sync_camera_changes(edited_cam)
+        # Sync changes back to session state; other tabs need a full rerun
+        if _sync_camera_changes(edited_cam, source_cam):
+            st.rerun()
 
 
-def _sync_camera_changes(edited_df: pd.DataFrame) -> None:
-    """Sync edited camera data back to session state."""
+def _sync_camera_changes(edited_df: pd.DataFrame, source_df: pd.DataFrame) -> bool:
+    """Sync edited camera data back to session state. Returns True if anything changed."""
     if edited_df is None:
-        return
+        return False
     
-    incident_map = {str(x['id']): i for i, x in enumerate(st.session_state.incidents)}
+    changed = _changed_rows(edited_df, source_df, CAMERA_EDIT_COLS)
+    if changed.empty:
+        return False
     
-    for _, row in edited_df.iterrows():
-        idx = incident_map.get(str(row['id']))
-        if idx is not None:
-            st.session_state.incidents[idx]['level'] = row['level']
+    sync_edited_data(changed, st.session_state.incidents, CAMERA_EDIT_COLS)
+    mark_incidents_changed()
+    return True
@@ -1,14 +1,23 @@
 """
 Map View component for the Property Claim Mapper.
 """
+import math
+from functools import lru_cache
+
 import streamlit as st
 import folium
+from branca.element import MacroElement
 from folium.plugins import LocateControl
+from jinja2 import Template
 from streamlit_folium import st_folium
 
-from config import NEW_MARKER_ICON, TILE_SERVERS
-from utils.icons import get_custom_icon, get_standard_icon, get_draft_marker_icon
-from utils.data_helpers import calculate_click_threshold
+from config import TILE_SERVERS
+from utils.icons import get_custom_icon_url, get_standard_icon, get_draft_marker_icon_url
+from utils.data_helpers import calculate_click_threshold, find_nearest_marker
+from utils.incident_store import get_incident_store
+
+_ACTIVE_SPAN = "<span style='color: green;'>[SELECTED]</span>"
+_IDLE_SPAN = "<span style='color: #888;'>Click to select</span>"
 
 
 def render_map_view(map_locked: bool) -> None:
@@ -26,13 +35,15 @@ def render_map_view(map_locked: bool) -> None:
     
     # Sync state from actual map interaction (if any)
     # We skip this if a jump is requested to avoid overwriting the jump target
-    # Sync state from actual map interaction (if any)
-    # We skip this if a jump is requested to avoid overwriting the jump target
-    
     map_key = f"main_map_{st.session_state.get('map_reset_counter', 0)}"
     
-    if not st.session_state.get('_map_jump_requested') and map_key in st.session_state and st.session_state[map_key]:
-        _update_map_state(st.session_state[map_key])
+    map_state = st.session_state.get(map_key)
+    if (
+        not st.session_state.get('_map_jump_requested')
+        and map_state
+        and map_state != st.session_state.get('_pre_jump_map_state')
+    ):
+        _update_map_state(map_state)
     
     # Use live map state if available (persists user's pan/zoom)
     # Otherwise fall back to project config (for initial load)
@@ -41,37 +52,37 @@ def render_map_view(map_locked: bool) -> None:
     if 'live_map_zoom' not in st.session_state:
         st.session_state.live_map_zoom = st.session_state.project_data['map_config']['zoom']
     
-    # Define a dynamic key to force map reload when jumping
-    # We'll use a session state counter for this
+    # The map component is only re-mounted (new key) when the tile style
+    # changes; jumps pan the existing map instead
     if 'map_reset_counter' not in st.session_state:
         st.session_state.map_reset_counter = 0
-
-    # Check if we should jump to a new location (from search)
-    if st.session_state.get('_map_jump_requested'):
-        st.session_state.live_map_center = st.session_state.project_data['map_config']['center'].copy()
-        st.session_state.live_map_zoom = st.session_state.project_data['map_config']['zoom']
-        st.session_state.map_reset_counter += 1  # Increment to force re-mount
-        st.session_state._map_jump_requested = False
     
     # Determine current style
     selected_style = st.session_state.get("map_style_selection", "Hybrid")
     tile_url = TILE_SERVERS.get(selected_style)
     
+    prev_style = st.session_state.get('prev_map_style')
+    if prev_style is not None and prev_style != selected_style:
+        st.session_state.map_reset_counter += 1
+    st.session_state.prev_map_style = selected_style
+
+    # Check if we should jump to a new location (from search, new or loaded project)
+    jump = bool(st.session_state.get('_map_jump_requested'))
+    if jump:
+        # The component keeps reporting this view until it has panned, so
+        # remember it and ignore it until then
+        st.session_state._pre_jump_map_state = st.session_state.get(
+            f"main_map_{st.session_state.map_reset_counter}"
+        )
+        st.session_state.live_map_center = st.session_state.project_data['map_config']['center'].copy()
+        st.session_state.live_map_zoom = st.session_state.project_data['map_config']['zoom']
+        st.session_state._map_jump_requested = False
+    
     # Create map at live position
     m = folium.Map(
         location=st.session_state.live_map_center,
         zoom_start=st.session_state.live_map_zoom,
-        tiles=tile_url,
-        attr="Map data &copy; contributors" if "openstreetmap" in tile_url else "Esri",
-        zoom_control=interaction_opt,
-        scrollWheelZoom=interaction_opt,
-        dragging=interaction_opt,
-        doubleClickZoom=interaction_opt,
-        zoom_snap=0.2,
-        zoom_delta=0.2,
-        wheel_px_per_zoom_level=120,
-        attributionControl=False,
-        max_zoom=22
+        **_base_map_options(tile_url, interaction_opt)
     )
     
     LocateControl(auto_start=False).add_to(m)
@@ -82,69 +93,150 @@ def render_map_view(map_locked: bool) -> None:
     # Add draft marker if exists
     _add_draft_marker(m)
     
-    # Render map - don't pass center/zoom to st_folium as it forces recenter
-    # The folium.Map sets initial position, key maintains state across reruns
+    # Render map - center/zoom are only passed to st_folium on a jump, since
+    # they force a recenter. Otherwise the folium.Map sets the initial position
+    # and the key maintains state across reruns.
     map_data = st_folium(
         m,
+        center=st.session_state.live_map_center if jump else None,
+        zoom=st.session_state.live_map_zoom if jump else None,
         height=700,
         width="100%",
         returned_objects=["center", "zoom", "last_clicked"],
         key=f"main_map_{st.session_state.map_reset_counter}" 
     )
     
-    # Update live map state from returned data (for next render)
-    _update_map_state(map_data)
+    # On a jump run the component still reports the pre-jump view and the
+    # already-handled last click, so neither is applied
+    if jump:
+        return
+    
+    # Update live map state from returned data (for next render), unless the
+    # component has not yet caught up with the last jump
+    if map_data != st.session_state.get('_pre_jump_map_state'):
+        _update_map_state(map_data)
     
     # Handle clicks
     _handle_map_click(map_data, map_locked)
 
 
+@lru_cache(maxsize=16)
+def _base_map_options(tile_url: str, interaction_opt: bool) -> dict:
+    """
+    Return the folium.Map options that only depend on tile style and lock state.
+    
+    Callers unpack the result with ``**`` and must not modify it.
+    """
+    return {
+        'tiles': tile_url,
+        'attr': "Map data &copy; contributors" if "openstreetmap" in tile_url else "Esri",
+        'zoom_control': interaction_opt,
+        'scrollWheelZoom': interaction_opt,
+        'dragging': interaction_opt,
+        'doubleClickZoom': interaction_opt,
+        'zoom_snap': 0.2,
+        'zoom_delta': 0.2,
+        'wheel_px_per_zoom_level': 120,
+        'attributionControl': False,
+        'max_zoom': 22,
+    }
+
+
+class _MarkerLayer(MacroElement):
+    """
+    Client-side marker layer.
+    
+    Ships all custom-icon markers to the browser as one JSON payload and
+    creates the Leaflet markers there, instead of rendering a Marker, Icon and
+    Tooltip template per marker in Python. Each icon data URI is sent once in
+    ``icons`` and markers refer to it by index.
+    """
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            (function() {
+                var iconUrls = {{ this.icons|tojson }};
+                var markers = {{ this.markers|tojson }};
+                var iconCache = {};
+                for (var i = 0; i < markers.length; i++) {
+                    var mk = markers[i];
+                    var iconKey = mk.icon + ":" + mk.size;
+                    if (!(iconKey in iconCache)) {
+                        iconCache[iconKey] = L.icon({
+                            iconUrl: iconUrls[mk.icon],
+                            iconSize: [mk.size, mk.size]
+                        });
+                    }
+                    L.marker([mk.lat, mk.lng], {icon: iconCache[iconKey]}).bindTooltip(
+                        "<div>" + mk.tooltip + "</div>", {sticky: true}
+                    ).addTo({{ this._parent.get_name() }});
+                }
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, icons: list, markers: list):
+        super().__init__()
+        self._name = "MarkerLayer"
+        self.icons = icons
+        self.markers = markers
+
+
 def _add_markers_to_map(m: folium.Map) -> None:
     """Add all incident/camera markers to the map."""
-    for inc in st.session_state.incidents:
-        is_active = str(inc.get('id', '')) == str(st.session_state.get('active_incident_id', ''))
-        icon_size = (30, 30) if is_active else (20, 20)
+    store = get_incident_store()
+    active_id = str(st.session_state.get('active_incident_id', ''))
+    
+    icon_index = {}
+    layer_markers = []
+    for marker_id, marker_type, level, lat, lng, description, date_str in zip(
+        store.ids, store.types, store.levels, store.lats, store.lngs,
+        store.descriptions, store.dates
+    ):
+        is_active = str(marker_id) == active_id
         
-        custom_icon = get_custom_icon(inc['type'], inc['level'], size=icon_size)
+        icon_url = get_custom_icon_url(marker_type, level)
         
         # Build tooltip content
-        tooltip_html = _build_tooltip(inc, is_active)
+        tooltip_html = _tooltip_html(
+            marker_type, marker_id, level, description, date_str, is_active
+        )
         
-        if custom_icon:
-            folium.Marker(
-                [inc['lat'], inc['lng']],
-                tooltip=folium.Tooltip(tooltip_html, permanent=False),
-                icon=custom_icon
-            ).add_to(m)
+        if icon_url:
+            layer_markers.append({
+                'lat': float(lat),
+                'lng': float(lng),
+                'icon': icon_index.setdefault(icon_url, len(icon_index)),
+                'size': 30 if is_active else 20,
+                'tooltip': tooltip_html,
+            })
         else:
             folium.Marker(
-                [inc['lat'], inc['lng']],
+                [lat, lng],
                 tooltip=folium.Tooltip(tooltip_html, permanent=False),
-                icon=get_standard_icon(inc['type'], inc['level'])
+                icon=get_standard_icon(marker_type, level)
             ).add_to(m)
+    
+    if layer_markers:
+        _MarkerLayer(list(icon_index), layer_markers).add_to(m)
 
 
-def _build_tooltip(inc: dict, is_active: bool) -> str:
-    """Build HTML tooltip content for a marker."""
-    if inc['type'] == "Incident":
-        tooltip_lines = [
-            f"<b>{inc['type']} #{inc['id']}</b>",
-            f"Status: {inc['level']}",
-            f"Type: {inc.get('description', 'N/A')}",
-            f"Date: {inc.get('date', 'N/A')}",
-        ]
-    else:
-        tooltip_lines = [
-            f"<b>{inc['type']} #{inc['id']}</b>",
-            f"Status: {inc['level']}",
-        ]
-    
-    if is_active:
-        tooltip_lines.append("<span style='color: green;'>[SELECTED]</span>")
-    else:
-        tooltip_lines.append("<span style='color: #888;'>Click to select</span>")
-    
-    return "<br>".join(tooltip_lines)
+@lru_cache(maxsize=1024)
+def _tooltip_html(
+    marker_type: str,
+    marker_id: str,
+    level: str,
+    description: str,
+    date_str: str,
+    is_active: bool
+) -> str:
+    """Render tooltip HTML, memoized on the fields the tooltip displays."""
+    hint = _ACTIVE_SPAN if is_active else _IDLE_SPAN
+    if marker_type == "Incident":
+        return (
+            f"<b>{marker_type} #{marker_id}</b><br>Status: {level}<br>"
+            f"Type: {description}<br>Date: {date_str}<br>{hint}"
+        )
+    return f"<b>{marker_type} #{marker_id}</b><br>Status: {level}<br>{hint}"
 
 
 def _add_draft_marker(m: folium.Map) -> None:
@@ -153,32 +245,49 @@ def _add_draft_marker(m: folium.Map) -> None:
         return
     
     d = st.session_state.draft_marker
-    draft_icon = get_draft_marker_icon(NEW_MARKER_ICON)
+    icon_url = get_draft_marker_icon_url()
     
-    folium.Marker(
-        [d['lat'], d['lng']],
-        icon=draft_icon if draft_icon else folium.Icon(color="gray", icon="plus"),
-        tooltip="New Marker (Unsaved)"
-    ).add_to(m)
+    if icon_url:
+        _MarkerLayer([icon_url], [{
+            'lat': float(d['lat']),
+            'lng': float(d['lng']),
+            'icon': 0,
+            'size': 25,
+            'tooltip': "New Marker (Unsaved)",
+        }]).add_to(m)
+    else:
+        folium.Marker(
+            [d['lat'], d['lng']],
+            icon=folium.Icon(color="gray", icon="plus"),
+            tooltip="New Marker (Unsaved)"
+        ).add_to(m)
 
 
 def _update_map_state(map_data: dict) -> None:
-    """Update session state with current map center and zoom."""
+    """Update session state with current map center and zoom, if they moved."""
     if map_data.get('center'):
         new_center = [
             map_data['center']['lat'],
             map_data['center']['lng']
         ]
-        # Update live state (used for next render)
-        st.session_state.live_map_center = new_center
-        # Also update project config (for saving)
-        st.session_state.project_data['map_config']['center'] = new_center
+        old_center = st.session_state.get('live_map_center')
+        if not (
+            old_center
+            and math.isclose(old_center[0], new_center[0], abs_tol=1e-7)
+            and math.isclose(old_center[1], new_center[1], abs_tol=1e-7)
+        ):
+            # Update live state (used for next render)
+            st.session_state.live_map_center = new_center
+            # Also update project config (for saving)
+            st.session_state.project_data['map_config']['center'] = new_center
     
     if map_data.get('zoom'):
-        # Update live state
-        st.session_state.live_map_zoom = map_data['zoom']
-        # Also update project config
-        st.session_state.project_data['map_config']['zoom'] = map_data['zoom']
+        old_zoom = st.session_state.get('live_map_zoom')
+        if old_zoom is None or not math.isclose(old_zoom, map_data['zoom'], abs_tol=1e-3):
+            # Update live state
+            st.session_state.live_map_zoom = map_data['zoom']
+            # Also update project config
+            st.session_state.project_data['map_config']['zoom'] = map_data['zoom']
 
 
 def _handle_map_click(map_data: dict, map_locked: bool) -> None:
@@ -193,16 +302,12 @@ def _handle_map_click(map_data: dict, map_locked: bool) -> None:
     # Calculate dynamic threshold based on current zoom
     # Use live zoom state if available for better accuracy
     current_zoom = st.session_state.get('live_map_zoom', st.session_state.project_data['map_config'].get('zoom', 18))
-    threshold = calculate_click_threshold(current_zoom)
+    threshold = calculate_click_threshold(round(current_zoom, 1))
     
     # Check if click is near an existing marker
-    found_id = None
-    min_dist = threshold
-    for inc in st.session_state.incidents:
-        dist = ((inc['lat'] - c_lat)**2 + (inc['lng'] - c_lng)**2)**0.5
-        if dist < min_dist:
-            found_id = inc['id']
-            min_dist = dist
+    store = get_incident_store()
+    hit_idx = find_nearest_marker(store.coords, c_lat, c_lng, threshold)
+    found_id = store.ids[hit_idx] if hit_idx is not None else None
     
     if found_id:
         # Select existing marker
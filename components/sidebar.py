@@ -1,24 +1,37 @@
 """
 Sidebar UI component for the Property Claim Mapper.
 """
+import hashlib
 import json
-import os
+import logging
 from datetime import date
 from typing import Any, Dict, List
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import folium
-import io
 
 from config import (
     BANNER_PATH, INCIDENT_TYPES, DEFAULT_LOCATION,
     CAMERA_REQUIRED_COLS, INCIDENT_REQUIRED_COLS,
     get_default_project_data, TILE_SERVERS
 )
-from utils.data_helpers import get_next_id
+from utils.assets import preload_assets
+from utils.data_helpers import allocate_ids, reset_id_counters
+from utils.incident_store import append_incidents, get_incident_store, mark_incidents_changed
 from utils.pdf_generator import create_pdf
-from utils.map_utils import generate_static_map
+from utils.map_utils import encode_map_image, generate_static_map
+
+logger = logging.getLogger(__name__)
+
+# CSV import value normalization (compared after str().lower())
+_TRUTHY_VALUES = frozenset({'yes', 'true', '1'})
+_CAMERA_ON_VALUES = _TRUTHY_VALUES | {'working', 'active'}
+_SERIOUS_VALUES = frozenset({'emergency', 'critical', 'high'})
+_LIGHT_VALUES = frozenset({'low', 'minor'})
+_CAMERA_LEVELS = frozenset({'Functioning', 'Not Functioning'})
+_INCIDENT_LEVELS = frozenset({'Light', 'Medium', 'Serious'})
 
 
 def render_sidebar() -> bool:
@@ -29,8 +42,9 @@ def render_sidebar() -> bool:
         Boolean indicating if map is locked
     """
     # Banner
-    if os.path.exists(BANNER_PATH):
-        st.sidebar.image(BANNER_PATH, width="stretch")
+    banner = preload_assets().get(BANNER_PATH)
+    if banner:
+        st.sidebar.image(banner, width="stretch")
     else:
         st.sidebar.title("Boardwalk Property Management")
     
@@ -87,13 +101,16 @@ def render_sidebar() -> bool:
 
 def _render_selected_marker_section() -> None:
     """Render the selected marker section for deletion."""
-    if not st.session_state.get('active_incident_id'):
+    ss = st.session_state
+    active_id = ss.get('active_incident_id')
+    if not active_id:
         return
     
+    active_id = str(active_id)
     active_idx = -1
     active_inc = None
-    for i, inc in enumerate(st.session_state.incidents):
-        if str(inc['id']) == str(st.session_state.active_incident_id):
+    for i, inc in enumerate(ss.incidents):
+        if str(inc['id']) == active_id:
             active_idx = i
             active_inc = inc
             break
@@ -106,12 +123,13 @@ def _render_selected_marker_section() -> None:
     st.sidebar.caption(f"Location: {active_inc['lat']:.5f}, {active_inc['lng']:.5f}")
     
     if st.sidebar.button("🗑️ Delete This Marker", type="primary", width="stretch"):
-        st.session_state.incidents.pop(active_idx)
-        st.session_state.active_incident_id = None
+        ss.incidents.pop(active_idx)
+        mark_incidents_changed()
+        ss.active_incident_id = None
         st.rerun()
     
     if st.sidebar.button("Clear Selection", width="stretch"):
-        st.session_state.active_incident_id = None
+        ss.active_incident_id = None
         st.rerun()
 
 
@@ -156,7 +174,7 @@ def _render_draft_marker_section(map_locked: bool) -> None:
             n_claim, n_impact, n_comp = False, False, 0.0
         
         if st.form_submit_button("Create Marker"):
-            new_id = get_next_id(st.session_state.incidents, n_type)
+            new_id = allocate_ids(n_type)[0]
             new_inc = {
                 "id": new_id,
                 "lat": draft['lat'],
@@ -171,7 +189,7 @@ def _render_draft_marker_section(map_locked: bool) -> None:
                 "description": n_desc,
                 "compensation": float(n_comp) if n_comp is not None else 0.0
             }
-            st.session_state.incidents.append(new_inc)
+            append_incidents([new_inc])
             st.session_state.draft_marker = None
             st.success("Created!")
             st.rerun()
@@ -190,6 +208,8 @@ def _render_project_controls() -> None:
         """Callback to reset project data safely before rerun."""
         st.session_state.project_data = get_default_project_data()
         st.session_state.incidents = []
+        mark_incidents_changed()
+        reset_id_counters()
         st.session_state.active_incident_id = None
         st.session_state.draft_marker = None
         
@@ -203,14 +223,15 @@ def _render_project_controls() -> None:
         # Ensure project data reflects these defaults
         st.session_state.project_data['property'] = "New Property"
         st.session_state.project_data['year'] = str(date.today().year)
+        st.session_state.pop('current_project_title', None)
 
         # Clear persistent map state
         if 'live_map_center' in st.session_state:
             del st.session_state.live_map_center
         if 'live_map_zoom' in st.session_state:
             del st.session_state.live_map_zoom
-        if 'generated_pdf_bytes' in st.session_state:
-            del st.session_state.generated_pdf_bytes
+        st.session_state.pop('generated_pdf_bytes', None)
+        st.session_state.pop('generated_pdf_key', None)
             
         st.session_state._map_jump_requested = True  # Signal map to jump to default
 
@@ -225,30 +246,38 @@ def _render_project_controls() -> None:
         # but explicit rerun ensures everything refreshes properly.
         # Wait, if callback runs, the script re-executes. We don't need another st.rerun().
         pass
-    if 'prop_input' in st.session_state:
-        st.session_state.project_data['property'] = st.session_state.prop_input
-    if 'year_input' in st.session_state:
-        st.session_state.project_data['year'] = st.session_state.year_input
         
     # Sync current map state if available
-    map_key = f"main_map_{st.session_state.get('map_reset_counter', 0)}"
-    
-    if map_key in st.session_state and st.session_state[map_key]:
-        m_state = st.session_state[map_key]
+    ss = st.session_state
+    project_data = ss.project_data
+    map_key = f"main_map_{ss.get('map_reset_counter', 0)}"
+    
+    # Only write when the view actually moved, so the saved-JSON fingerprint
+    # (and anything keyed on map_config) stays stable across idle reruns.
+    # While a jump is pending, or until the map reports a view other than the
+    # one it showed before the jump, the component value is stale and would
+    # overwrite the jump target.
+    m_state = ss.get(map_key)
+    if (
+        m_state
+        and not ss.get('_map_jump_requested')
+        and m_state != ss.get('_pre_jump_map_state')
+    ):
+        map_config = project_data['map_config']
         if m_state.get('center'):
-            st.session_state.project_data['map_config']['center'] = [
-                m_state['center']['lat'], m_state['center']['lng']
-            ]
-        if m_state.get('zoom'):
-            st.session_state.project_data['map_config']['zoom'] = m_state['zoom']
+            new_center = [m_state['center']['lat'], m_state['center']['lng']]
+            if map_config.get('center') != new_center:
+                map_config['center'] = new_center
+        if m_state.get('zoom') and map_config.get('zoom') != m_state['zoom']:
+            map_config['zoom'] = m_state['zoom']
 
-    st.session_state.project_data['incidents'] = st.session_state.incidents
+    project_data['incidents'] = ss.incidents
     
     # Save Current Project
     st.sidebar.download_button(
         "💾 Save Current",
-        data=json.dumps(st.session_state.project_data, indent=4),
-        file_name=f"{st.session_state.project_data['name'].replace(' ', '_')}_project.json",
+        data=_project_json(),
+        file_name=f"{project_data['name'].replace(' ', '_')}_project.json",
         mime="application/json",
         width="stretch"
     )
@@ -268,12 +297,20 @@ def _render_project_controls() -> None:
                 d = json.load(load_file)
                 st.session_state.project_data = d
                 st.session_state.incidents = d.get('incidents', [])
+                mark_incidents_changed()
+                reset_id_counters()
                 
-                # Update UI fields if they exist in loaded data
+                # Update UI fields if they exist in loaded data, otherwise
+                # keep the current header values in the project
                 if 'property' in d:
                     st.session_state.prop_input = d['property']
+                elif 'prop_input' in st.session_state:
+                    d['property'] = st.session_state.prop_input
                 if 'year' in d:
                     st.session_state.year_input = d['year']
+                elif 'year_input' in st.session_state:
+                    d['year'] = st.session_state.year_input
+                st.session_state.pop('current_project_title', None)
                 
                 st.session_state.active_incident_id = None
                 st.session_state.show_load_project = False
@@ -284,6 +321,29 @@ def _render_project_controls() -> None:
                 st.error(f"Invalid project file: {e}")
 
 
+def _project_json() -> str:
+    """
+    Serialize project_data for the save button, reusing the last result.
+    
+    download_button needs its data on every rerun, so the JSON text is kept
+    in session state and only re-encoded when the incidents version or one
+    of the small project fields changes.
+    """
+    project_data = st.session_state.project_data
+    meta = {k: v for k, v in project_data.items() if k != 'incidents'}
+    fingerprint = (
+        st.session_state.get('incidents_version', 0),
+        len(st.session_state.incidents),
+        json.dumps(meta, sort_keys=True, default=str)
+    )
+    
+    cached = st.session_state.get('_project_json_cache')
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, json.dumps(project_data, indent=4))
+        st.session_state._project_json_cache = cached
+    return cached[1]
+
+
 def _render_data_import() -> None:
     """Render data import section."""
     st.sidebar.title("Data Import")
@@ -356,59 +416,125 @@ def _render_camera_import() -> None:
         "- `location` (optional): Address text"
     )
     
-    cam_file = st.sidebar.file_uploader(
-        "Upload Camera CSV",
-        type=['csv'],
-        key="camera_csv_uploader"
-    )
-    if cam_file:
-        try:
-            df_cam = pd.read_csv(cam_file)
-            
-            missing_cols = [col for col in CAMERA_REQUIRED_COLS if col not in df_cam.columns]
-            if missing_cols:
-                st.sidebar.error(f"Missing required columns: {missing_cols}")
-            else:
-                if st.sidebar.button("✅ Import Cameras", key="import_cam_btn", type="primary"):
-                    count = _import_cameras(df_cam)
-                    st.sidebar.success(f"Imported {count} cameras!")
-                    st.session_state.show_camera_import = False
-                    st.rerun()
-        except Exception as e:
-            st.sidebar.error(f"Error reading CSV: {e}")
+    # Uploading a file doesn't rerun the app; the CSV is only read on submit
+    with st.sidebar.form("camera_import_form", border=False):
+        cam_file = st.file_uploader(
+            "Upload Camera CSV",
+            type=['csv'],
+            key="camera_csv_uploader"
+        )
+        submitted = st.form_submit_button("✅ Import Cameras", type="primary")
+    
+    if not submitted:
+        return
+    if cam_file is None:
+        st.sidebar.error("Choose a CSV file to import.")
+        return
+    
+    try:
+        df_cam = _read_csv(cam_file)
+    except Exception as e:
+        st.sidebar.error(f"Error reading CSV: {e}")
+        return
+    
+    missing_cols = [col for col in CAMERA_REQUIRED_COLS if col not in df_cam.columns]
+    if missing_cols:
+        st.sidebar.error(f"Missing required columns: {missing_cols}")
+        return
+    
+    count = _import_cameras(df_cam)
+    st.sidebar.success(f"Imported {count} cameras!")
+    st.session_state.show_camera_import = False
+    st.rerun()
+
+
+# Free-text CSV columns, read as written instead of letting the parser infer
+# dates or numbers (which would then be stringified differently)
+_CSV_TEXT_DTYPES = {
+    'level': str,
+    'date': str,
+    'parties': str,
+    'location': str,
+    'description': str,
+}
+
+
+def _read_csv(csv_file) -> pd.DataFrame:
+    """
+    Read an uploaded CSV, using pandas' multithreaded PyArrow parser.
+    
+    Falls back to the default parser if pyarrow is unavailable or rejects the
+    file (e.g. ragged rows the C parser tolerates).
+    """
+    try:
+        return pd.read_csv(csv_file, engine='pyarrow', dtype=_CSV_TEXT_DTYPES)
+    except (ImportError, ValueError) as e:
+        logger.debug(f"PyArrow CSV parse failed, using default engine: {e}")
+        csv_file.seek(0)
+        return pd.read_csv(csv_file, dtype=_CSV_TEXT_DTYPES)
+
+
+def _text_values(col: pd.Series) -> pd.Series:
+    """
+    Stringify a CSV column with blank cells as 'nan'.
+    
+    The PyArrow parser reads blanks in str columns as None, the default parser
+    as NaN; normalizing first keeps imports identical whichever engine ran.
+    """
+    return col.astype(object).where(col.notna(), 'nan').astype(str)
 
 
 def _import_cameras(df_cam: pd.DataFrame) -> int:
     """Import cameras from DataFrame."""
-    count = 0
     center = st.session_state.project_data['map_config']['center']
     
-    for _, row in df_cam.iterrows():
-        lat = float(row['lat']) if 'lat' in df_cam.columns and pd.notna(row.get('lat')) else center[0]
-        lng = float(row['lng']) if 'lng' in df_cam.columns and pd.notna(row.get('lng')) else center[1]
-        
-        level = str(row['level']).strip()
-        if level not in ['Functioning', 'Not Functioning']:
-            level = 'Functioning' if level.lower() in ['yes', 'true', '1', 'working', 'active'] else 'Not Functioning'
-        
-        new_camera = {
-            "id": get_next_id(st.session_state.incidents, "Camera"),
+    lats = _coord_column(df_cam, 'lat', center[0])
+    lngs = _coord_column(df_cam, 'lng', center[1])
+    
+    levels = _text_values(df_cam['level']).str.strip()
+    fallback = np.where(
+        levels.str.lower().isin(_CAMERA_ON_VALUES),
+        'Functioning', 'Not Functioning'
+    )
+    levels = levels.where(levels.isin(_CAMERA_LEVELS), fallback)
+    
+    ids = allocate_ids("Camera", len(df_cam))
+    today = str(date.today())
+    
+    return append_incidents(
+        {
+            "id": cam_id,
             "lat": lat,
             "lng": lng,
             "type": "Camera",
             "level": level,
-            "location": row.get('location', f"{lat:.5f}, {lng:.5f}"),
-            "date": str(date.today()),
+            "location": location,
+            "date": today,
             "parties": "",
             "claim_filed": False,
             "premium_impact": False,
             "description": "Camera Feed",
             "compensation": 0.0
         }
-        st.session_state.incidents.append(new_camera)
-        count += 1
-    
-    return count
+        for cam_id, lat, lng, level, location in zip(
+            ids, lats, lngs, levels.tolist(), _location_column(df_cam, lats, lngs)
+        )
+    )
+
+
+def _coord_column(df: pd.DataFrame, col: str, default: float) -> List[float]:
+    """Return a coordinate column as floats, using default for missing values."""
+    if col not in df.columns:
+        return [default] * len(df)
+    return pd.to_numeric(df[col], errors='coerce').fillna(default).tolist()
+
+
+def _location_column(df: pd.DataFrame, lats: List[float], lngs: List[float]) -> List[Any]:
+    """Return the location column, or formatted coordinates if the CSV has none."""
+    if 'location' in df.columns:
+        # Blank cells stay NaN, as the default parser reads them
+        return df['location'].astype(object).where(df['location'].notna(), np.nan).tolist()
+    return [f"{lat:.5f}, {lng:.5f}" for lat, lng in zip(lats, lngs)]
 
 
 def _render_incident_import() -> None:
@@ -421,158 +547,235 @@ def _render_incident_import() -> None:
         "- `date`, `compensation`, `claim_filed`, `premium_impact`, `parties` (optional)"
     )
     
-    inc_file = st.sidebar.file_uploader(
-        "Upload Incident CSV",
-        type=['csv'],
-        key="incident_csv_uploader"
-    )
-    if inc_file:
-        try:
-            df_inc = pd.read_csv(inc_file)
-            
-            missing_cols = [col for col in INCIDENT_REQUIRED_COLS if col not in df_inc.columns]
-            if missing_cols:
-                st.sidebar.error(f"Missing required columns: {missing_cols}")
-            else:
-                if st.sidebar.button("✅ Import Incidents", key="import_inc_btn", type="primary"):
-                    count = _import_incidents(df_inc)
-                    st.sidebar.success(f"Imported {count} incidents!")
-                    st.session_state.show_incident_import = False
-                    st.rerun()
-        except Exception as e:
-            st.sidebar.error(f"Error reading CSV: {e}")
+    # Uploading a file doesn't rerun the app; the CSV is only read on submit
+    with st.sidebar.form("incident_import_form", border=False):
+        inc_file = st.file_uploader(
+            "Upload Incident CSV",
+            type=['csv'],
+            key="incident_csv_uploader"
+        )
+        submitted = st.form_submit_button("✅ Import Incidents", type="primary")
+    
+    if not submitted:
+        return
+    if inc_file is None:
+        st.sidebar.error("Choose a CSV file to import.")
+        return
+    
+    try:
+        df_inc = _read_csv(inc_file)
+    except Exception as e:
+        st.sidebar.error(f"Error reading CSV: {e}")
+        return
+    
+    missing_cols = [col for col in INCIDENT_REQUIRED_COLS if col not in df_inc.columns]
+    if missing_cols:
+        st.sidebar.error(f"Missing required columns: {missing_cols}")
+        return
+    
+    count = _import_incidents(df_inc)
+    st.sidebar.success(f"Imported {count} incidents!")
+    st.session_state.show_incident_import = False
+    st.rerun()
 
 
 def _import_incidents(df_inc: pd.DataFrame) -> int:
     """Import incidents from DataFrame."""
-    count = 0
     center = st.session_state.project_data['map_config']['center']
+    n_rows = len(df_inc)
     
-    for _, row in df_inc.iterrows():
-        lat = float(row['lat']) if 'lat' in df_inc.columns and pd.notna(row.get('lat')) else center[0]
-        lng = float(row['lng']) if 'lng' in df_inc.columns and pd.notna(row.get('lng')) else center[1]
-        
-        level = str(row['level']).strip()
-        if level not in ['Light', 'Medium', 'Serious']:
-            if level.lower() in ['emergency', 'critical', 'high']:
-                level = 'Serious'
-            elif level.lower() in ['low', 'minor']:
-                level = 'Light'
-            else:
-                level = 'Medium'
-        
-        new_incident = {
-            "id": get_next_id(st.session_state.incidents, "Incident"),
+    lats = _coord_column(df_inc, 'lat', center[0])
+    lngs = _coord_column(df_inc, 'lng', center[1])
+    
+    levels = _text_values(df_inc['level']).str.strip()
+    lowered = levels.str.lower()
+    fallback = np.select(
+        [lowered.isin(_SERIOUS_VALUES), lowered.isin(_LIGHT_VALUES)],
+        ['Serious', 'Light'],
+        default='Medium'
+    )
+    levels = levels.where(levels.isin(_INCIDENT_LEVELS), fallback)
+    
+    def text_column(col: str, default: str) -> List[str]:
+        if col not in df_inc.columns:
+            return [default] * n_rows
+        return _text_values(df_inc[col]).tolist()
+    
+    def flag_column(col: str) -> List[bool]:
+        if col not in df_inc.columns:
+            return [False] * n_rows
+        return _text_values(df_inc[col]).str.lower().isin(_TRUTHY_VALUES).tolist()
+    
+    if 'compensation' in df_inc.columns:
+        compensation = pd.to_numeric(df_inc['compensation'], errors='coerce').fillna(0.0).tolist()
+    else:
+        compensation = [0.0] * n_rows
+    
+    ids = allocate_ids("Incident", n_rows)
+    
+    return append_incidents(
+        {
+            "id": inc_id,
             "lat": lat,
             "lng": lng,
             "type": "Incident",
             "level": level,
-            "location": row.get('location', f"{lat:.5f}, {lng:.5f}"),
-            "date": str(row.get('date', date.today())),
-            "parties": str(row.get('parties', '')),
-            "claim_filed": str(row.get('claim_filed', '')).lower() in ['yes', 'true', '1'],
-            "premium_impact": str(row.get('premium_impact', '')).lower() in ['yes', 'true', '1'],
-            "description": str(row['description']),
-            "compensation": float(row.get('compensation', 0)) if pd.notna(row.get('compensation')) else 0.0
+            "location": location,
+            "date": inc_date,
+            "parties": parties,
+            "claim_filed": claim_filed,
+            "premium_impact": premium_impact,
+            "description": description,
+            "compensation": comp
         }
-        st.session_state.incidents.append(new_incident)
-        count += 1
-    
-    return count
+        for (
+            inc_id, lat, lng, level, location, inc_date, parties,
+            claim_filed, premium_impact, description, comp
+        ) in zip(
+            ids, lats, lngs, levels.tolist(), _location_column(df_inc, lats, lngs),
+            text_column('date', str(date.today())), text_column('parties', ''),
+            flag_column('claim_filed'), flag_column('premium_impact'),
+            _text_values(df_inc['description']).tolist(), compensation
+        )
+    )
 
 
 def _render_pdf_section() -> None:
     """Render PDF and Interactive Map export section."""
-    if not st.session_state.incidents:
+    ss = st.session_state
+    if not ss.incidents:
         st.sidebar.warning("No data to generate report.")
         return
 
     st.sidebar.title("Export Report")
     st.sidebar.caption("Generate a professional PDF report with a companion map.")
 
-    # PDF Report Section
-    # PDF Report Section
-    # Unified Generate & Download Button
-    
-    # We use a cached function to generate the PDF bytes. 
-    # This ensures that we don't re-generate the map/PDF on every rerun, 
-    # but only when the inputs (map center/zoom/incidents) change.
-    
-    @st.cache_data(show_spinner="Generating Report...", ttl=300)
-    def _get_pdf_payload(
-        incidents: List[Dict],
-        project_data: Dict,
-        current_center: List[float],
-        current_zoom: int,
-        style_selection: str
-    ) -> bytes:
-        """Cached helper to generate the PDF report payload."""
-        # 1. Generate PNG Map
-        incidents_only = [i for i in incidents if i.get('type') == 'Incident']
-        cameras_only = [i for i in incidents if i.get('type') == 'Camera']
-        
-        tile_url = TILE_SERVERS.get(style_selection)
-        
-        live_config = {
-            'center': current_center,
-            'zoom': current_zoom
-        }
-        
-        img = generate_static_map(
-            incidents=incidents_only,
-            cameras=cameras_only,
-            map_config=live_config,
-            auto_fit=False,
-            url=tile_url
-        )
-        
-        buf_png = io.BytesIO()
-        img.save(buf_png, format="PNG")
-        bytes_png = buf_png.getvalue()
-        
-        # 2. Generate PDF
-        title = project_data.get('name', 'Report')
-        if 'current_project_title' in st.session_state:
-             title = st.session_state.current_project_title
-             
-        pdf_bytes = create_pdf(
-            project_data,
-            incidents,
-            project_title=title,
-            map_tile_url=tile_url,
-            existing_map_image=bytes_png
-        )
-        return pdf_bytes
-
     # Collect current state for the cache key
-    live_center = st.session_state.get('live_map_center', DEFAULT_LOCATION)
-    live_zoom = st.session_state.get('live_map_zoom', 13)
-    curr_style = st.session_state.get("map_style_selection", "Hybrid")
+    live_center = ss.get('live_map_center', DEFAULT_LOCATION)
+    live_zoom = ss.get('live_map_zoom', 13)
+    curr_style = ss.get("map_style_selection", "Hybrid")
+    title = ss.get('current_project_title', ss.project_data.get('name', 'Report'))
+    
+    # The report is only generated on request. A prepared report stays
+    # downloadable until the markers, the map view or the title change.
+    pdf_key = (
+        ss.get('incidents_version', 0),
+        len(ss.incidents),
+        tuple(live_center),
+        live_zoom,
+        curr_style,
+        title
+    )
     
-    # We pass the incidents list directly. Since it's a list of dicts, 
-    # st.cache_data will hash it correctly to detect changes.
+    if st.sidebar.button("🧾 Prepare PDF Report", width="stretch"):
+        try:
+            payload_key = _pdf_payload_key(
+                ss.incidents,
+                ss.project_data,
+                live_center,
+                live_zoom,
+                curr_style,
+                title
+            )
+            store = get_incident_store()
+            ss.generated_pdf_bytes = _get_pdf_payload(
+                payload_key,
+                ss.incidents,
+                store.type_records('Incident'),
+                store.type_records('Camera'),
+                ss.project_data,
+                live_center,
+                live_zoom,
+                curr_style,
+                title
+            )
+            ss.generated_pdf_key = pdf_key
+        except Exception as e:
+            st.sidebar.error(f"Failed to generate report: {e}")
     
-    # WARNING: This call is "lazy" inside the download_button logic in a way, 
-    # but to make it truly unified, we calculate it here.
-    # Because it is cached, it will be instant on subsequent reruns if nothing changed.
-    # When something changes (e.g. pan map), this line will run and show the spinner.
+    if 'generated_pdf_bytes' not in ss:
+        return
     
-    try:
-        pdf_payload = _get_pdf_payload(
-            st.session_state.incidents,
-            st.session_state.project_data,
-            live_center,
-            live_zoom,
-            curr_style
-        )
-        
+    if ss.get('generated_pdf_key') == pdf_key:
         st.sidebar.download_button(
             label="📄 Export PDF Report",
-            data=pdf_payload,
+            data=ss.generated_pdf_bytes,
             file_name="report.pdf",
             mime="application/pdf",
             width="stretch",
-            type="primary"
+            type="primary",
+            on_click="ignore"
         )
-    except Exception as e:
-        st.sidebar.error(f"Failed to generate report: {e}")
+    else:
+        st.sidebar.caption("Map or data changed since the report was prepared.")
+
+
+def _pdf_payload_key(
+    incidents: List[Dict],
+    project_data: Dict,
+    current_center: List[float],
+    current_zoom: float,
+    style_selection: str,
+    title: str
+) -> str:
+    """
+    Fingerprint every input the PDF report depends on.
+    
+    Hashing one canonical JSON string is much cheaper than letting Streamlit
+    walk the incidents list recursively on every cache lookup.
+    """
+    # project_data['incidents'] mirrors the incidents list; hash it once
+    project_fields = {k: v for k, v in project_data.items() if k != 'incidents'}
+    canonical = json.dumps(
+        [incidents, project_fields, current_center, current_zoom, style_selection, title],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+@st.cache_resource(show_spinner="Generating Report...", ttl=300, max_entries=8)
+def _get_pdf_payload(
+    payload_key: str,
+    _incidents: List[Dict],
+    _incidents_only: List[Dict],
+    _cameras_only: List[Dict],
+    _project_data: Dict,
+    _current_center: List[float],
+    _current_zoom: float,
+    _style_selection: str,
+    _title: str
+) -> bytes:
+    """
+    Generate the PDF report payload, cached on payload_key.
+    
+    The underscore-prefixed arguments are not hashed by Streamlit; payload_key
+    (from _pdf_payload_key) must cover all of them. The returned bytes are
+    immutable, so they are shared instead of copied per call.
+    """
+    # 1. Generate Map Image
+    tile_url = TILE_SERVERS.get(_style_selection)
+    
+    live_config = {
+        'center': _current_center,
+        'zoom': _current_zoom
+    }
+    
+    img = generate_static_map(
+        incidents=_incidents_only,
+        cameras=_cameras_only,
+        map_config=live_config,
+        auto_fit=False,
+        url=tile_url
+    )
+    
+    map_bytes = encode_map_image(img)
+    
+    # 2. Generate PDF
+    return create_pdf(
+        _project_data,
+        _incidents,
+        project_title=_title,
+        map_tile_url=tile_url,
+        existing_map_image=map_bytes
+    )
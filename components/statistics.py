@@ -1,17 +1,22 @@
 """
 Statistics component for the Property Claim Mapper.
 """
+import heapq
 import logging
+import math
+from typing import Any, Dict, List
 
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
+import altair as alt
 import pandas as pd
 import streamlit as st
 
+from utils.incident_store import get_incident_store
+
 logger = logging.getLogger(__name__)
 
+# Camera status colors, shared by the pie slices and legend
+_CAMERA_STATUS_COLORS = {'Functioning': '#28a745', 'Not Functioning': '#dc3545'}
+
 
 def render_statistics() -> None:
     """Render the statistics tab content."""
@@ -21,19 +26,10 @@ def render_statistics() -> None:
         st.info("No data available for statistics.")
         return
     
-    stats_df = pd.DataFrame(st.session_state.incidents)
-    
-    # Separate cameras and incidents
-    cameras_df = (
-        stats_df[stats_df['type'] == 'Camera']
-        if 'type' in stats_df.columns
-        else pd.DataFrame()
-    )
-    incidents_df = (
-        stats_df[stats_df['type'] == 'Incident']
-        if 'type' in stats_df.columns
-        else pd.DataFrame()
-    )
+    # Per-type frames are built once per incidents version, not per rerun
+    store = get_incident_store()
+    cameras_df = store.type_frame('Camera')
+    incidents_df = store.type_frame('Incident')
     
     # Camera Stats Panel
     _render_camera_stats(cameras_df)
@@ -76,31 +72,32 @@ def _render_camera_stats(cameras_df: pd.DataFrame) -> None:
 
 
 def _render_camera_pie_chart(cameras_df: pd.DataFrame) -> None:
-    """Render the camera status distribution pie chart."""
+    """Render the camera status distribution pie chart (drawn in the browser)."""
     try:
         cam_status_counts = cameras_df['level'].value_counts()
+        chart_df = cam_status_counts.rename_axis('Status').reset_index(name='Count')
         
-        with plt.ioff():
-            fig_cam, ax_cam = plt.subplots(figsize=(2.5, 2))
-            fig_cam.patch.set_alpha(0.0)
-            
-            colors_cam = [
-                '#28a745' if label == 'Functioning' else '#dc3545'
-                for label in cam_status_counts.index
-            ]
-            
-            ax_cam.pie(
-                cam_status_counts,
-                labels=cam_status_counts.index,
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=colors_cam
-            )
-            ax_cam.axis('equal')
-            ax_cam.set_title("Camera Status Distribution")
-            
-            st.pyplot(fig_cam)
-            plt.close(fig_cam)
+        statuses = chart_df['Status'].tolist()
+        color_scale = alt.Scale(
+            domain=statuses,
+            range=[_CAMERA_STATUS_COLORS.get(status, '#dc3545') for status in statuses]
+        )
+        
+        base = alt.Chart(chart_df).transform_joinaggregate(
+            Total='sum(Count)'
+        ).transform_calculate(
+            Share='datum.Count / datum.Total'
+        ).encode(
+            theta=alt.Theta('Count:Q', stack=True),
+            color=alt.Color('Status:N', scale=color_scale),
+            tooltip=['Status:N', 'Count:Q', alt.Tooltip('Share:Q', format='.1%')]
+        )
+        pie = base.mark_arc(outerRadius=80)
+        labels = base.mark_text(radius=105).encode(text=alt.Text('Share:Q', format='.1%'))
+        
+        st.altair_chart(
+            (pie + labels).properties(title="Camera Status Distribution", height=240)
+        )
             
     except Exception as e:
         logger.error(f"Failed to render camera pie chart: {e}")
@@ -128,30 +125,54 @@ def _render_incident_stats(incidents_df: pd.DataFrame) -> None:
     inc_c2.metric("Total Compensation", f"${total_compensation:,.2f}")
     
     # Top 5 Claims by Compensation
-    _render_top_claims(incidents_df)
+    _render_top_claims(st.session_state.incidents)
     
     # Top 5 Incident Types by Count
     _render_incident_type_chart(incidents_df)
 
 
-def _render_top_claims(incidents_df: pd.DataFrame) -> None:
+def _render_top_claims(incidents: List[Dict[str, Any]]) -> None:
     """Render the top 5 claims by compensation table."""
     st.markdown("##### Top 5 Claims by Compensation")
     
-    if 'compensation' not in incidents_df.columns:
+    claims = [
+        inc for inc in incidents
+        if inc.get('type') == 'Incident' and 'compensation' in inc
+    ]
+    if not claims:
         st.info("No compensation data.")
         return
     
-    top5_comp = incidents_df.nlargest(5, 'compensation')[
-        ['id', 'description', 'level', 'date', 'compensation']
-    ].copy()
-    
-    top5_comp['compensation'] = top5_comp['compensation'].apply(
-        lambda x: f"${x:,.2f}"
+    # Only the 5 winning rows are turned into a DataFrame
+    top5 = heapq.nlargest(5, claims, key=_compensation_key)
+    top5_comp = pd.DataFrame(
+        [
+            {
+                'ID': inc.get('id'),
+                'Incident Type': inc.get('description'),
+                'Level': inc.get('level'),
+                'Date': inc.get('date'),
+                'Compensation': _compensation_key(inc),
+            }
+            for inc in top5
+        ]
     )
-    top5_comp.columns = ['ID', 'Incident Type', 'Level', 'Date', 'Compensation']
     
-    st.dataframe(top5_comp, hide_index=True, width="stretch")
+    # Keep the column numeric and let the Styler format it at render time
+    st.dataframe(
+        top5_comp.style.format({'Compensation': "${:,.2f}"}),
+        hide_index=True,
+        width="stretch"
+    )
+
+
+def _compensation_key(incident: Dict[str, Any]) -> float:
+    """Compensation as a float for ranking; missing or invalid values count as 0."""
+    try:
+        value = float(incident.get('compensation') or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if math.isnan(value) else value
 
 
 def _render_incident_type_chart(incidents_df: pd.DataFrame) -> None:
@@ -164,33 +185,18 @@ def _render_incident_type_chart(incidents_df: pd.DataFrame) -> None:
     
     try:
         incident_type_counts = incidents_df['description'].value_counts().head(5)
+        chart_df = incident_type_counts.rename_axis('Incident Type').reset_index(name='Count')
         
-        with plt.ioff():
-            fig_inc, ax_inc = plt.subplots(figsize=(4, 2))
-            fig_inc.patch.set_alpha(0.0)
-            
-            bars = ax_inc.barh(
-                incident_type_counts.index[::-1],
-                incident_type_counts.values[::-1],
-                color='#FF6B6B'
-            )
-            
-            ax_inc.set_xlabel("Count")
-            ax_inc.xaxis.set_major_locator(MaxNLocator(integer=True))
-            ax_inc.set_title("Top 5 Incident Types")
-            
-            for bar, val in zip(bars, incident_type_counts.values[::-1]):
-                ax_inc.text(
-                    bar.get_width() + 0.1,
-                    bar.get_y() + bar.get_height() / 2,
-                    str(val),
-                    va='center',
-                    fontsize=10
-                )
-            
-            plt.tight_layout()
-            st.pyplot(fig_inc)
-            plt.close(fig_inc)
+        bars = alt.Chart(chart_df).mark_bar(color='#FF6B6B').encode(
+            x=alt.X('Count:Q', axis=alt.Axis(tickMinStep=1, format='d')),
+            y=alt.Y('Incident Type:N', sort='-x', title=None),
+            tooltip=['Incident Type:N', 'Count:Q']
+        )
+        values = bars.mark_text(align='left', dx=3).encode(text='Count:Q')
+        
+        st.altair_chart(
+            (bars + values).properties(title="Top 5 Incident Types", height=200)
+        )
             
     except Exception as e:
         logger.error(f"Failed to render incident type chart: {e}")
@@ -83,6 +83,55 @@ CUSTOM_CSS = """
         padding-left: 3rem !important;
         padding-right: 3rem !important;
     }
+    
+    /* Rounded label boxes next to the header inputs */
+    .label-box {
+        background-color: black;
+        color: white;
+        padding: 8px 16px;
+        border-radius: 8px;
+        font-weight: 600;
+        font-size: 14px;
+        text-align: center;
+        white-space: nowrap;
+        width: 100%;
+        height: 42px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        margin: -2px 0 0 0; /* Nudge up to match text input baseline */
+    }
+    
+    /* Success/Error Box Styling for Horizontal Layout */
+    .status-box-success {
+        background-color: #d1e7dd;
+        color: #0f5132;
+        padding: 8px 12px;
+        border-radius: 8px;
+        border: 1px solid #badbcc;
+        font-size: 14px;
+        height: 42px;
+        display: flex;
+        align-items: center;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+    
+    .status-box-error {
+        background-color: #f8d7da;
+        color: #842029;
+        padding: 8px 12px;
+        border-radius: 8px;
+        border: 1px solid #f5c2c7;
+        font-size: 14px;
+        height: 42px;
+        display: flex;
+        align-items: center;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
 </style>
 """
 
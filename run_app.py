@@ -1,7 +1,42 @@
 import sys
 import os
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from streamlit.web import cli as stcli
 
+# Heavy modules the app imports on its first run. utils.icons reads every
+# marker icon when imported.
+_WARMUP_MODULES = (
+    "numpy",
+    "pandas",
+    "folium",
+    "geopy",
+    "staticmap",
+    "PIL.ImageDraw",
+    "utils.icons",
+)
+
+# Kept at module level so the warm-up threads are not torn down early
+_warmup_executor = None
+
+
+def _warm_up_geocoder():
+    from utils.geocoding import warm_up_geocoder
+    warm_up_geocoder()
+
+
+def _start_warmup():
+    # Import modules and build shared clients in the background while the
+    # Streamlit server starts, so the first page load finds them ready.
+    # Import locks make this safe against the script importing them too.
+    global _warmup_executor
+    _warmup_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="warmup")
+    for name in _WARMUP_MODULES:
+        _warmup_executor.submit(importlib.import_module, name)
+    _warmup_executor.submit(_warm_up_geocoder)
+    _warmup_executor.shutdown(wait=False)
+
+
 def main():
     # Set the path to the app.py file relative to the executable
     if getattr(sys, 'frozen', False):
@@ -12,6 +47,10 @@ def main():
     
     app_path = os.path.join(base_path, "app.py")
     
+    if base_path not in sys.path:
+        sys.path.insert(0, base_path)
+    _start_warmup()
+    
     # Set the command line arguments for streamlit
     sys.argv = [
         "streamlit", 
@@ -0,0 +1,34 @@
+"""Check that CSV imports give the same records with either pandas parser."""
+import io
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("streamlit")
+
+from components.sidebar import _CSV_TEXT_DTYPES, _location_column, _text_values  # noqa: E402
+
+CSV_WITH_BLANKS = (
+    "level,description,lat,lng,date,parties,location\n"
+    "Serious,Rear-end collision,33.6450,-117.9329,2024-01-05,,Main St\n"
+    ",,33.6455,-117.9330,,Driver A,\n"
+)
+
+
+def _records(engine: str) -> dict:
+    df = pd.read_csv(io.StringIO(CSV_WITH_BLANKS), engine=engine, dtype=_CSV_TEXT_DTYPES)
+    records = {
+        col: _text_values(df[col]).tolist()
+        for col in ('level', 'description', 'date', 'parties')
+    }
+    # NaN != NaN, so compare locations through their repr
+    records['location'] = [repr(v) for v in _location_column(df, [], [])]
+    return records
+
+
+def test_blank_cells_match_across_engines():
+    pyarrow_records = _records('pyarrow')
+    assert pyarrow_records == _records('c')
+    assert pyarrow_records['parties'] == ['nan', 'Driver A']
+    assert pyarrow_records['location'] == ["'Main St'", 'nan']
@@ -1,15 +1,32 @@
 """Utility functions for the Property Claim Mapper application."""
-from utils.icons import get_custom_icon, get_standard_icon
-from utils.pdf_generator import create_pdf
-from utils.geocoding import search_location
-from utils.data_helpers import get_next_id, get_filtered_data, calculate_click_threshold
+from utils.icons import get_custom_icon, get_custom_icon_url, get_standard_icon
+from utils.pdf_generator import create_pdf, create_pdfs_batch
+from utils.geocoding import search_location, cached_search_location, warm_up_geocoder
+from utils.data_helpers import (
+    get_next_id, get_next_ids, allocate_ids, reset_id_counters,
+    get_filtered_data, calculate_click_threshold
+)
+from utils.incident_store import (
+    IncidentStore, get_incident_store, mark_incidents_changed, append_incidents
+)
 
 __all__ = [
     'get_custom_icon',
+    'get_custom_icon_url',
     'get_standard_icon',
     'create_pdf',
+    'create_pdfs_batch',
     'search_location',
+    'cached_search_location',
+    'warm_up_geocoder',
     'get_next_id',
+    'get_next_ids',
+    'allocate_ids',
+    'reset_id_counters',
     'get_filtered_data',
     'calculate_click_threshold',
+    'IncidentStore',
+    'get_incident_store',
+    'mark_incidents_changed',
+    'append_incidents',
 ]
@@ -0,0 +1,69 @@
+"""
+Static asset preloading for the Property Claim Mapper.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from config import BANNER_PATH
+
+logger = logging.getLogger(__name__)
+
+
+def _read_bytes(path: str) -> Optional[bytes]:
+    """
+    Read a file from disk.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        File contents, or None if the file is missing or unreadable
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as e:
+        logger.warning(f"Failed to read asset {path}: {e}")
+        return None
+
+
+def read_files(paths: List[str]) -> Dict[str, bytes]:
+    """
+    Read several files concurrently.
+
+    The reads overlap, so the total wait is roughly the slowest read rather
+    than the sum of all of them.
+
+    Args:
+        paths: Paths of the files to read
+
+    Returns:
+        Mapping of path to file bytes (missing files are omitted)
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        contents = list(pool.map(_read_bytes, paths))
+    return {path: data for path, data in zip(paths, contents) if data is not None}
+
+
+@st.cache_resource(show_spinner=False)
+def preload_assets() -> Dict[str, bytes]:
+    """
+    Read the UI's static images once per process.
+
+    Marker icons are loaded separately when ``utils.icons`` is imported.
+
+    Returns:
+        Mapping of asset path to file bytes (missing files are omitted)
+    """
+    paths = [BANNER_PATH]
+    assets = read_files(paths)
+    logger.info(f"Preloaded {len(assets)} of {len(paths)} assets")
+    return assets
@@ -2,13 +2,33 @@
 Data helper utilities for incident management.
 """
 import logging
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from utils.incident_store import get_incident_store
+
 logger = logging.getLogger(__name__)
 
+# Session-state keys holding the next free ID number per prefix
+_ID_COUNTER_KEYS = {"I": "_next_id_inc", "C": "_next_id_cam"}
+
+
+def _max_id_number(incidents: List[Dict[str, Any]], prefix: str) -> int:
+    """Return the highest numeric suffix among IDs starting with prefix (0 if none)."""
+    if not incidents:
+        return 0
+    
+    ids = pd.Series([str(inc.get('id', '')) for inc in incidents], dtype=object)
+    # IDs that don't match the prefix + digits pattern become NaN and are ignored
+    nums = ids.str.extract(rf'^{prefix}(\d+)$', expand=False).dropna()
+    if nums.empty:
+        return 0
+    return int(nums.astype(np.int64).max())
+
 
 def get_next_id(incidents: List[Dict[str, Any]], incident_type: str) -> str:
     """
@@ -21,29 +41,67 @@ def get_next_id(incidents: List[Dict[str, Any]], incident_type: str) -> str:
     Returns:
         Next available ID string (e.g., "I0001" or "C0001")
     """
+    return get_next_ids(incidents, incident_type, 1)[0]
+
+
+def get_next_ids(incidents: List[Dict[str, Any]], incident_type: str, count: int) -> List[str]:
+    """
+    Generate a block of sequential IDs, scanning the existing IDs only once.
+    
+    Args:
+        incidents: List of existing incident dictionaries
+        incident_type: Either "Incident" or "Camera"
+        count: Number of IDs to allocate
+        
+    Returns:
+        List of the next available ID strings (e.g., ["I0004", "I0005"])
+    """
     prefix = "I" if incident_type == "Incident" else "C"
-    max_num = 0
+    start = _max_id_number(incidents, prefix) + 1
+    return [f"{prefix}{num:04d}" for num in range(start, start + count)]
+
+
+def allocate_ids(incident_type: str, count: int = 1) -> List[str]:
+    """
+    Allocate sequential IDs from a per-session counter.
     
-    for inc in incidents:
-        curr_id = str(inc.get('id', ''))
-        if curr_id.startswith(prefix):
-            try:
-                num = int(curr_id[1:])
-                if num > max_num:
-                    max_num = num
-            except ValueError as e:
-                logger.debug(f"Could not parse ID '{curr_id}': {e}")
-                continue
+    The counter is seeded from ``st.session_state.incidents`` on first use,
+    after which each allocation is O(1) instead of a rescan of every ID.
+    Deleted IDs are not reused. Call ``reset_id_counters`` whenever the
+    incidents list is replaced wholesale.
+    
+    Args:
+        incident_type: Either "Incident" or "Camera"
+        count: Number of IDs to allocate
+        
+    Returns:
+        List of newly allocated ID strings (e.g., ["C0007"])
+    """
+    prefix = "I" if incident_type == "Incident" else "C"
+    counter_key = _ID_COUNTER_KEYS[prefix]
     
-    return f"{prefix}{max_num + 1:04d}"
+    start = st.session_state.get(counter_key)
+    if start is None:
+        start = _max_id_number(st.session_state.incidents, prefix) + 1
+    st.session_state[counter_key] = start + count
+    return [f"{prefix}{num:04d}" for num in range(start, start + count)]
+
 
+def reset_id_counters() -> None:
+    """Forget the session ID counters so they are re-seeded from the incidents list."""
+    for counter_key in _ID_COUNTER_KEYS.values():
+        st.session_state.pop(counter_key, None)
 
-def calculate_click_threshold(zoom_level: int) -> float:
+
+@lru_cache(maxsize=256)
+def calculate_click_threshold(zoom_level: float) -> float:
     """
     Calculate dynamic click threshold based on map zoom level.
     
     At higher zoom levels (more zoomed in), the threshold should be smaller.
     At lower zoom levels (more zoomed out), the threshold should be larger.
+    Results are cached; callers should round fractional zooms (the map snaps
+    to 0.2 steps) so float jitter doesn't create new cache entries.
     
     Args:
         zoom_level: Current map zoom level (typically 1-21)
@@ -51,6 +109,14 @@ def calculate_click_threshold(zoom_level: int) -> float:
     Returns:
         Distance threshold for click detection
     """
+    # Whole zoom levels come straight from the precomputed table
+    if float(zoom_level).is_integer() and 0 <= zoom_level < len(_THRESHOLD_LUT):
+        return _THRESHOLD_LUT[int(zoom_level)]
+    return _threshold_for_zoom(zoom_level)
+
+
+def _threshold_for_zoom(zoom_level: float) -> float:
+    """Evaluate the click threshold formula for any zoom level."""
     # Base threshold at zoom level 18 is ~5.5 meters (0.00005 degrees)
     # Each zoom level doubles/halves the scale
     base_zoom = 18
@@ -64,38 +130,97 @@ def calculate_click_threshold(zoom_level: int) -> float:
     return max(0.00001, min(0.01, threshold))
 
 
-@st.cache_data
+# Click thresholds for whole zoom levels 0-22 (the map's max_zoom)
+_THRESHOLD_LUT = tuple(_threshold_for_zoom(z) for z in range(23))
+
+
+def find_nearest_marker(
+    coords: np.ndarray,
+    lat: float,
+    lng: float,
+    threshold: float
+) -> Optional[int]:
+    """
+    Find the marker closest to a clicked point, within a distance threshold.
+    
+    Distances are computed for all markers at once with NumPy and compared
+    squared, so no square root is taken.
+    
+    Args:
+        coords: (N, 2) array of marker (lat, lng) pairs
+        lat: Latitude of the clicked point
+        lng: Longitude of the clicked point
+        threshold: Maximum distance (in degrees) for a marker to count as hit
+        
+    Returns:
+        Row index of the nearest marker within the threshold, or None
+    """
+    if len(coords) == 0:
+        return None
+    
+    diff = coords - np.array([lat, lng])
+    d2 = np.einsum('ij,ij->i', diff, diff)
+    idx = int(d2.argmin())
+    
+    if d2[idx] < threshold * threshold:
+        return idx
+    return None
+
+
 def get_filtered_data(
-    incidents_json: str
+    incidents: List[Dict[str, Any]]
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Filter incidents into separate DataFrames for incidents and cameras.
     
-    Uses Streamlit caching to avoid redundant filtering on reruns.
+    For the session's own incidents list the frames come from the incident
+    store, which rebuilds them only when the incidents change. The returned
+    frames are not copied (store frames are shared), so they must be treated
+    as read-only; copy a frame before modifying it.
     
     Args:
-        incidents_json: JSON string of incidents list (for cache key stability)
+        incidents: List of incident dictionaries
         
     Returns:
         Tuple of (incidents_df, cameras_df)
     """
-    import json
-    incidents = json.loads(incidents_json)
-    
     if not incidents:
         return pd.DataFrame(), pd.DataFrame()
     
+    if incidents is st.session_state.get('incidents'):
+        store = get_incident_store()
+        return store.type_frame('Incident'), store.type_frame('Camera')
+    
     df = pd.DataFrame(incidents)
     
     if 'type' not in df.columns:
         return pd.DataFrame(), pd.DataFrame()
     
-    incidents_df = df[df['type'] == 'Incident'].copy()
-    cameras_df = df[df['type'] == 'Camera'].copy()
+    # Encode the type column once as integer codes (what a categorical
+    # column holds) so both masks are integer comparisons. The frame is
+    # local, so the positional selections need no defensive copy; callers
+    # still must not modify them in place.
+    codes, categories = pd.factorize(df['type'])
+    incidents_df = df.iloc[codes == _category_code(categories, 'Incident')]
+    cameras_df = df.iloc[codes == _category_code(categories, 'Camera')]
     
     return incidents_df, cameras_df
 
 
+def _category_code(categories: pd.Index, value: str) -> int:
+    """Return the factorize code for ``value``, or -2 (matches nothing) if absent."""
+    matches = np.flatnonzero(categories == value)
+    return int(matches[0]) if len(matches) else -2
+
+
+# Per-column conversions applied when edited values are written back
+_SYNC_CONVERTERS = {
+    'compensation': lambda series: series.astype(float).fillna(0.0),
+    'claim_filed': lambda series: series.astype(bool),
+    'premium_impact': lambda series: series.astype(bool),
+}
+
+
 def sync_edited_data(
     edited_df: pd.DataFrame,
     incidents: List[Dict[str, Any]],
@@ -117,18 +242,23 @@ def sync_edited_data(
     
     incident_map = {str(x['id']): i for i, x in enumerate(incidents)}
     
-    for _, row in edited_df.iterrows():
-        idx = incident_map.get(str(row['id']))
+    # Pull each synced column out once (with its type conversion) instead of
+    # indexing a row Series per cell
+    columns = {}
+    for col in columns_to_sync:
+        if col not in edited_df.columns:
+            continue
+        convert = _SYNC_CONVERTERS.get(col)
+        series = edited_df[col]
+        columns[col] = (convert(series) if convert else series).tolist()
+    
+    ids = edited_df['id'].astype(str).tolist()
+    for pos, row_id in enumerate(ids):
+        idx = incident_map.get(row_id)
         if idx is not None:
-            for col in columns_to_sync:
-                if col in row.index:
-                    value = row[col]
-                    # Type conversion based on column
-                    if col == 'compensation':
-                        value = float(value) if pd.notna(value) else 0.0
-                    elif col in ('claim_filed', 'premium_impact'):
-                        value = bool(value)
-                    incidents[idx][col] = value
+            incident = incidents[idx]
+            for col, values in columns.items():
+                incident[col] = values[pos]
     
     return incidents
 
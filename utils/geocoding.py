@@ -2,14 +2,78 @@
 Geocoding utilities for location search.
 """
 import logging
+from functools import lru_cache, partial
 from typing import Any, Optional, Tuple
 
+import streamlit as st
+from geopy.adapters import RequestsAdapter
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import ArcGIS
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_geolocator(user_agent: str) -> ArcGIS:
+    """
+    Return a shared ArcGIS geocoder for the given user agent.
+    
+    Each geocoder owns a requests.Session, so reusing one instance keeps the
+    HTTPS connection alive between searches instead of paying DNS + TLS
+    setup on every query.
+    
+    Args:
+        user_agent: User agent string for the geocoder
+        
+    Returns:
+        Process-wide ArcGIS geocoder instance
+    """
+    return ArcGIS(
+        user_agent=user_agent,
+        adapter_factory=partial(
+            RequestsAdapter,
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=2
+        )
+    )
+
+
+@lru_cache(maxsize=4)
+def _get_rate_limited_geocode(user_agent: str) -> RateLimiter:
+    """
+    Return the shared geocoder's ``geocode`` wrapped in a rate limiter.
+    
+    Calls from all sessions go through the same limiter, so the service sees
+    at most one request per second from this process. Errors are retried
+    twice and then re-raised.
+    
+    Args:
+        user_agent: User agent string for the geocoder
+        
+    Returns:
+        Rate-limited geocode callable
+    """
+    return RateLimiter(
+        _get_geolocator(user_agent).geocode,
+        min_delay_seconds=1.0,
+        max_retries=2,
+        error_wait_seconds=2.0,
+        swallow_exceptions=False
+    )
+
+
+def warm_up_geocoder(user_agent: str = "property_claim_mapper") -> None:
+    """
+    Build the shared geocoder and rate limiter ahead of the first search.
+    
+    Args:
+        user_agent: User agent string for the geocoder
+    """
+    _get_rate_limited_geocode(user_agent)
+
+
 def search_location(
     query: str,
     user_agent: str = "property_claim_mapper"
@@ -33,8 +97,8 @@ def search_location(
         return None
     
     try:
-        geolocator = ArcGIS(user_agent=user_agent)
-        location = geolocator.geocode(query)
+        geocode = _get_rate_limited_geocode(user_agent)
+        location = geocode(query)
         
         if location:
             logger.info(f"Found location: {location.address}")
@@ -52,3 +116,28 @@ def search_location(
     except Exception as e:
         logger.error(f"Unexpected error during geocoding: {e}")
         raise
+
+
+def cached_search_location(query: str) -> Optional[Tuple[float, float, str]]:
+    """
+    Search for a location, reusing results of previous identical searches.
+    
+    The query is normalized (trimmed and lowercased) before it is used as the
+    cache key, so trivially different spellings of the same address share one
+    geocoder round-trip.
+    
+    Args:
+        query: Address or location search string
+        
+    Returns:
+        Tuple of (latitude, longitude, address) if found, None otherwise
+    """
+    if not query or not query.strip():
+        return None
+    return _cached_search(query.strip().lower())
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _cached_search(normalized_query: str) -> Optional[Tuple[float, float, str]]:
+    """Cached geocoder lookup keyed on the normalized query string."""
+    return search_location(normalized_query)
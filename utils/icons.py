@@ -5,26 +5,48 @@ import base64
 import logging
 import os
 from functools import lru_cache
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import folium
 
-from config import ICONS
+from config import ICONS, NEW_MARKER_ICON
+from utils.assets import read_files
 
 logger = logging.getLogger(__name__)
 
 
-@lru_cache(maxsize=32)
+def _preload_icons() -> Dict[str, str]:
+    """Read every configured marker icon and return base64 strings by path."""
+    paths = [path for icon_group in ICONS.values() for path in icon_group.values()]
+    paths.append(NEW_MARKER_ICON)
+    return {
+        path: base64.b64encode(data).decode()
+        for path, data in read_files(paths).items()
+    }
+
+
+# All configured icons are loaded once at import, so rendering never touches disk
+_ICON_BASE64: Dict[str, str] = _preload_icons()
+
+
+@lru_cache(maxsize=64)
 def _load_icon_base64(icon_path: str) -> Optional[str]:
     """
     Load and cache icon file as base64 string.
     
+    Configured icons are served from the import-time preload; other paths
+    are read from disk on first use.
+    
     Args:
         icon_path: Path to the icon file
         
     Returns:
         Base64 encoded string or None if loading fails
     """
+    encoded = _ICON_BASE64.get(icon_path)
+    if encoded is not None:
+        return encoded
+    
     if not os.path.exists(icon_path):
         return None
     
@@ -36,21 +58,21 @@ def _load_icon_base64(icon_path: str) -> Optional[str]:
         return None
 
 
-def get_custom_icon(
-    incident_type: str,
-    level: str,
-    size: Tuple[int, int] = (20, 20)
-) -> Optional[folium.CustomIcon]:
+@lru_cache(maxsize=64)
+def get_custom_icon_url(incident_type: str, level: str) -> Optional[str]:
     """
-    Load custom SVG icon as base64 data URI for Folium markers.
+    Resolve the custom SVG icon for a marker as a base64 data URI.
+    
+    The URI only depends on (type, level), so it is cached; the icon size is
+    applied by the caller. Folium icon elements are not cached because they
+    get re-parented when added to a marker.
     
     Args:
         incident_type: Either "Camera" or "Incident"
         level: Status level (e.g., "Functioning", "Light", "Medium", "Serious")
-        size: Tuple of (width, height) for the icon
         
     Returns:
-        Folium CustomIcon if successful, None otherwise
+        Data URI string if the icon is available, None otherwise
     """
     if incident_type == "Camera":
         status = "Functioning" if level == "Functioning" else "Not Functioning"
@@ -60,15 +82,59 @@ def get_custom_icon(
     
     if not icon_path:
         return None
+    return _icon_data_uri(icon_path)
+
+
+@lru_cache(maxsize=64)
+def _icon_data_uri(icon_path: str) -> Optional[str]:
+    """
+    Build and cache the finished data URI for an icon file.
     
+    Args:
+        icon_path: Path to the icon file
+        
+    Returns:
+        Data URI string, or None if the icon cannot be loaded
+    """
     encoded = _load_icon_base64(icon_path)
     if encoded:
         mime = "image/svg+xml" if icon_path.endswith(".svg") else "image/png"
-        icon_url = f"data:{mime};base64,{encoded}"
+        return f"data:{mime};base64,{encoded}"
+    return None
+
+
+def get_custom_icon(
+    incident_type: str,
+    level: str,
+    size: Tuple[int, int] = (20, 20)
+) -> Optional[folium.CustomIcon]:
+    """
+    Load custom SVG icon as base64 data URI for Folium markers.
+    
+    Args:
+        incident_type: Either "Camera" or "Incident"
+        level: Status level (e.g., "Functioning", "Light", "Medium", "Serious")
+        size: Tuple of (width, height) for the icon
+        
+    Returns:
+        Folium CustomIcon if successful, None otherwise
+    """
+    icon_url = get_custom_icon_url(incident_type, level)
+    if icon_url:
         return folium.CustomIcon(icon_url, icon_size=size)
     return None
 
 
+# Fallback icon colors by (type, level), and per type when the level is unknown
+_STANDARD_ICON_COLORS = {
+    ("Camera", "Functioning"): "green",
+    ("Incident", "Serious"): "red",
+    ("Incident", "Medium"): "orange",
+    ("Incident", "Light"): "green",
+}
+_STANDARD_DEFAULT_COLORS = {"Camera": "gray"}
+
+
 def get_standard_icon(incident_type: str, level: str) -> folium.Icon:
     """
     Return a standard Folium icon as fallback when custom icons are unavailable.
@@ -80,16 +146,9 @@ def get_standard_icon(incident_type: str, level: str) -> folium.Icon:
     Returns:
         Folium Icon with appropriate color
     """
-    color = "blue"
-    if incident_type == "Camera":
-        color = "green" if level == "Functioning" else "gray"
-    elif incident_type == "Incident":
-        if level == "Serious":
-            color = "red"
-        elif level == "Medium":
-            color = "orange"
-        elif level == "Light":
-            color = "green"
+    color = _STANDARD_ICON_COLORS.get((incident_type, level))
+    if color is None:
+        color = _STANDARD_DEFAULT_COLORS.get(incident_type, "blue")
     return folium.Icon(color=color, icon="info-sign")
 
 
@@ -104,8 +163,23 @@ def get_draft_marker_icon(icon_path: str, size: Tuple[int, int] = (25, 25)) -> O
     Returns:
         Folium CustomIcon if successful, None otherwise
     """
-    encoded = _load_icon_base64(icon_path)
-    if encoded:
-        icon_url = f"data:image/svg+xml;base64,{encoded}"
+    icon_url = get_draft_marker_icon_url(icon_path)
+    if icon_url:
         return folium.CustomIcon(icon_url, icon_size=size)
     return None
+
+
+def get_draft_marker_icon_url(icon_path: str = NEW_MARKER_ICON) -> Optional[str]:
+    """
+    Get the data URI for the draft/new marker icon.
+    
+    Served from the preloaded icon cache, so no file is read and no folium
+    element is built.
+    
+    Args:
+        icon_path: Path to the new marker icon
+        
+    Returns:
+        Data URI string if the icon could be loaded, None otherwise
+    """
+    return _icon_data_uri(icon_path)
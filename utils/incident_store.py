@@ -0,0 +1,192 @@
+"""
+Columnar snapshot of the session's incidents list.
+
+``st.session_state.incidents`` stays a list of dicts because that is the
+format the project JSON, the PDF report and the data editors exchange. Code
+that works on whole columns (marker rendering, click hit-testing) reads from
+an ``IncidentStore`` instead, which holds the same data as parallel arrays
+and is only rebuilt when the incidents list changes.
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+
+class IncidentStore:
+    """Structure-of-arrays view over a list of incident dictionaries."""
+
+    def __init__(self, incidents: List[Dict[str, Any]], key: Tuple[int, int, int]):
+        self.key = key
+        self.records = incidents
+        self.size = len(incidents)
+        self._frame = None
+        self._type_frames: Dict[str, pd.DataFrame] = {}
+        self._type_records: Dict[str, List[Dict[str, Any]]] = {}
+        self._type_masks: Dict[str, np.ndarray] = {}
+
+        columns = self._build_columns(incidents)
+        self.ids = columns['ids']
+        self.types = columns['types']
+        self.levels = columns['levels']
+        self.descriptions = columns['descriptions']
+        self.dates = columns['dates']
+        self.coords = columns['coords']
+
+    @staticmethod
+    def _build_columns(incidents: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Extract the column arrays for a list of incident dictionaries."""
+        return {
+            'ids': np.array([inc['id'] for inc in incidents], dtype=object),
+            'types': np.array([inc['type'] for inc in incidents], dtype=object),
+            'levels': np.array([inc['level'] for inc in incidents], dtype=object),
+            'descriptions': np.array(
+                [inc.get('description', 'N/A') for inc in incidents], dtype=object
+            ),
+            'dates': np.array([inc.get('date', 'N/A') for inc in incidents], dtype=object),
+            'coords': np.array(
+                [(inc['lat'], inc['lng']) for inc in incidents], dtype=np.float64
+            ).reshape(len(incidents), 2),
+        }
+
+    def extend(self, new_incidents: List[Dict[str, Any]], key: Tuple[int, int, int]) -> None:
+        """
+        Append column data for incidents that were just added to ``records``.
+        
+        Only the new rows are converted; existing columns are concatenated
+        with them instead of being rebuilt from every dictionary.
+        
+        Args:
+            new_incidents: The incidents appended to the end of ``records``
+            key: Store key matching the updated incidents list
+        """
+        columns = self._build_columns(new_incidents)
+        for name, values in columns.items():
+            setattr(self, name, np.concatenate([getattr(self, name), values]))
+        self.size += len(new_incidents)
+        self.key = key
+        self._frame = None
+        self._type_frames = {}
+        self._type_records = {}
+        self._type_masks = {}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Return the incidents as a DataFrame, built once per snapshot.
+        
+        The frame is shared by every caller until the incidents change, so
+        callers must not modify it in place.
+        """
+        if self._frame is None:
+            self._frame = pd.DataFrame(self.records)
+        return self._frame
+
+    def type_mask(self, incident_type: str) -> np.ndarray:
+        """
+        Return a boolean mask of the rows with the given type.
+        
+        Computed once per snapshot from the ``types`` column and shared, so
+        callers must not modify it.
+        """
+        mask = self._type_masks.get(incident_type)
+        if mask is None:
+            mask = self.types == incident_type
+            self._type_masks[incident_type] = mask
+        return mask
+
+    def type_frame(self, incident_type: str) -> pd.DataFrame:
+        """
+        Return the rows of ``to_dataframe()`` with the given type.
+        
+        Like the full frame, each per-type frame is built once per snapshot
+        and shared, so callers must not modify it in place.
+        """
+        frame = self._type_frames.get(incident_type)
+        if frame is None:
+            frame = self.to_dataframe()[self.type_mask(incident_type)]
+            self._type_frames[incident_type] = frame
+        return frame
+
+    def type_records(self, incident_type: str) -> List[Dict[str, Any]]:
+        """
+        Return the incident dictionaries with the given type, in list order.
+        
+        Built once per snapshot and shared; callers must not modify the list.
+        """
+        records = self._type_records.get(incident_type)
+        if records is None:
+            records = [self.records[i] for i in np.flatnonzero(self.type_mask(incident_type))]
+            self._type_records[incident_type] = records
+        return records
+
+    @property
+    def lats(self) -> np.ndarray:
+        """Latitude column."""
+        return self.coords[:, 0]
+
+    @property
+    def lngs(self) -> np.ndarray:
+        """Longitude column."""
+        return self.coords[:, 1]
+
+
+def mark_incidents_changed() -> None:
+    """Record that ``st.session_state.incidents`` was modified in place or replaced."""
+    st.session_state.incidents_version = st.session_state.get('incidents_version', 0) + 1
+
+
+def _store_key(incidents: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """Key identifying one state of ``st.session_state.incidents``."""
+    return (st.session_state.get('incidents_version', 0), id(incidents), len(incidents))
+
+
+def get_incident_store() -> IncidentStore:
+    """
+    Return the columnar snapshot of the current incidents list.
+
+    The snapshot is cached in session state and rebuilt when the incidents
+    version changes, or when the list is replaced or resized without a
+    version bump.
+
+    Returns:
+        IncidentStore for ``st.session_state.incidents``
+    """
+    incidents = st.session_state.incidents
+    key = _store_key(incidents)
+
+    store = st.session_state.get('_incident_store')
+    if store is None or store.key != key:
+        logger.debug(f"Rebuilding incident store for {len(incidents)} markers")
+        store = IncidentStore(incidents, key)
+        st.session_state._incident_store = store
+    return store
+
+
+def append_incidents(new_incidents: Iterable[Dict[str, Any]]) -> int:
+    """
+    Append incidents to ``st.session_state.incidents`` and record the change.
+
+    If the cached store is current, it is extended with just the new rows
+    instead of being rebuilt from the whole list on next access.
+
+    Args:
+        new_incidents: Incident dictionaries to add
+
+    Returns:
+        Number of incidents added
+    """
+    new_incidents = list(new_incidents)
+    incidents = st.session_state.incidents
+    store = st.session_state.get('_incident_store')
+    store_is_current = store is not None and store.key == _store_key(incidents)
+
+    incidents.extend(new_incidents)
+    mark_incidents_changed()
+
+    if store_is_current:
+        store.extend(new_incidents, _store_key(incidents))
+    return len(new_incidents)
@@ -2,11 +2,55 @@
 Shared utilities for static map generation.
 """
 import math
-from typing import Dict, List, Any
+from io import BytesIO
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 from staticmap import StaticMap
-from staticmap.staticmap import _lon_to_x, _lat_to_y
 from PIL import Image, ImageDraw
 
+# Camera fill by "is functioning"; incident fill by code (Light, Medium, Serious)
+_CAMERA_COLORS = ('#000000', '#28a745')
+_INCIDENT_COLORS = ('#ffc107', '#fd7e14', '#dc3545')
+_INCIDENT_COLOR_CODES = {'Medium': 1, 'Serious': 2}
+
+# JPEG quality used when a rendered map is embedded in a report
+MAP_JPEG_QUALITY = 85
+
+# Half-extent in pixels of the camera square (14px) and incident triangle (18px)
+_CAMERA_HALF = 7
+_INCIDENT_HALF = 9
+
+
+def _square_sprite(color: str) -> Image.Image:
+    """Rasterize a camera square (black 1px outline) on a transparent tile."""
+    side = 2 * _CAMERA_HALF + 1
+    sprite = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).rectangle(
+        [0, 0, side - 1, side - 1], fill=color, outline="black", width=1
+    )
+    return sprite
+
+
+def _triangle_sprite(color: str) -> Image.Image:
+    """Rasterize an incident triangle (black 1px outline) on a transparent tile."""
+    h = _INCIDENT_HALF
+    sprite = Image.new('RGBA', (2 * h + 1, 2 * h + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).polygon(
+        [(h, 0), (0, 2 * h), (2 * h, 2 * h)], fill=color, outline="black", width=1
+    )
+    return sprite
+
+
+# Pre-rasterized marker shapes, indexed like the color tuples above. Pasting
+# a sprite with its own alpha as the mask is pixel-identical to drawing the
+# shape at that offset, since the rasterization has no anti-aliasing.
+_CAMERA_SPRITES = tuple(_square_sprite(c) for c in _CAMERA_COLORS)
+_INCIDENT_SPRITES = tuple(_triangle_sprite(c) for c in _INCIDENT_COLORS)
+
 def generate_static_map(
     incidents: List[Dict],
     cameras: List[Dict],
@@ -21,16 +65,20 @@ def generate_static_map(
     """
     all_markers = incidents + cameras
     
+    # Coordinate columns, read once and shared by auto-fit and projection
+    inc_lats, inc_lngs = _marker_coords(incidents)
+    cam_lats, cam_lngs = _marker_coords(cameras)
+    
     # Extract base center/zoom from config if available
     config_center = map_config.get('center', [0, 0]) if map_config else [0, 0]
     config_zoom = map_config.get('zoom', 15) if map_config else 15
 
     # Determine zoom and center
     if auto_fit and all_markers:
-        lats = [m['lat'] for m in all_markers]
-        lngs = [m['lng'] for m in all_markers]
-        min_lat, max_lat = min(lats), max(lats)
-        min_lng, max_lng = min(lngs), max(lngs)
+        lats = np.concatenate([inc_lats, cam_lats])
+        lngs = np.concatenate([inc_lngs, cam_lngs])
+        min_lat, max_lat = float(lats.min()), float(lats.max())
+        min_lng, max_lng = float(lngs.min()), float(lngs.max())
         
         center_lat = (min_lat + max_lat) / 2
         center_lng = (min_lng + max_lng) / 2
@@ -52,38 +100,204 @@ def generate_static_map(
         center_lng = config_center[1]
         zoom = config_zoom
 
-    # Initialize map
-    m = StaticMap(width, height, 20, url_template=url) 
+    # Ensure zoom is an integer for tile servers
+    zoom = int(zoom)
+    m, background = _render_background(url, width, height, zoom, center_lng, center_lat)
+    # Markers are pasted onto a copy so the cached background stays clean
+    image = background.copy()
+
+    # Project coordinates to pixels and draw custom shapes. Markers that land
+    # on the same pixel with the same color draw an identical shape, so only
+    # the topmost (last) one of each such group is drawn.
+    cam_xs, cam_ys = _project_to_pixels(cam_lats, cam_lngs, zoom, m)
+    # Green square for functioning, Black square for not functioning
+    cam_colors = np.fromiter(
+        (c['level'] == 'Functioning' for c in cameras), dtype=np.int64, count=len(cameras)
+    )
+    for k in _topmost_unique(cam_xs, cam_ys, cam_colors).tolist():
+        sprite = _CAMERA_SPRITES[cam_colors[k]]
+        image.paste(sprite, (int(cam_xs[k]) - _CAMERA_HALF, int(cam_ys[k]) - _CAMERA_HALF), sprite)
+        
+    inc_xs, inc_ys = _project_to_pixels(inc_lats, inc_lngs, zoom, m)
+    # Yellow, orange, red triangle for incidents (Low, Medium, Serious)
+    inc_colors = np.fromiter(
+        (_INCIDENT_COLOR_CODES.get(i['level'], 0) for i in incidents), dtype=np.int64, count=len(incidents)
+    )
+    for k in _topmost_unique(inc_xs, inc_ys, inc_colors).tolist():
+        sprite = _INCIDENT_SPRITES[inc_colors[k]]
+        image.paste(sprite, (int(inc_xs[k]) - _INCIDENT_HALF, int(inc_ys[k]) - _INCIDENT_HALF), sprite)
+        
+    return image
+
+
+def encode_map_image(image: Image.Image) -> bytes:
+    """
+    Encode a rendered static map for embedding in a PDF.
+    
+    JPEG suits the photographic tile imagery and is several times smaller
+    than PNG; fpdf2 embeds JPEG data as-is instead of re-compressing it.
+    
+    Args:
+        image: Rendered map image
+        
+    Returns:
+        JPEG bytes
+    """
+    buf = BytesIO()
+    image.convert('RGB').save(buf, format='JPEG', quality=MAP_JPEG_QUALITY)
+    return buf.getvalue()
+
+
+def _topmost_unique(xs: np.ndarray, ys: np.ndarray, colors: np.ndarray) -> np.ndarray:
+    """
+    Find the markers that are visible after drawing in list order.
+    
+    A later marker with the same pixel position and color exactly covers an
+    earlier one, so only the last occurrence of each (x, y, color) is kept.
+    The result preserves draw order, so the image is unchanged.
+    
+    Args:
+        xs: Pixel x coordinates
+        ys: Pixel y coordinates
+        colors: Integer color codes
+        
+    Returns:
+        Sorted indices of the markers to draw
+    """
+    n = len(xs)
+    if n < 2:
+        return np.arange(n)
+    keys = np.column_stack([xs, ys, colors])[::-1]
+    _, first_in_reversed = np.unique(keys, axis=0, return_index=True)
+    return np.sort(n - 1 - first_in_reversed)
+
+
+@lru_cache(maxsize=1)
+def _tile_session() -> requests.Session:
+    """Return the process-wide HTTP session used for map tile requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=256)
+def _fetch_tile(url: str, timeout: Any, headers: Tuple[Tuple[str, str], ...]) -> bytes:
+    """
+    Download one map tile, memoized by URL.
+    
+    Failed requests raise, so they are not cached and StaticMap retries them.
+    
+    Args:
+        url: Tile URL
+        timeout: Request timeout passed to requests
+        headers: Request headers as sorted (name, value) pairs, so the
+            arguments stay hashable
+        
+    Returns:
+        Tile image bytes
+    """
+    res = _tile_session().get(url, timeout=timeout, headers=dict(headers))
+    if res.status_code != 200:
+        raise requests.HTTPError(f"Tile request failed with status {res.status_code}: {url}")
+    return res.content
+
+
+class _PooledStaticMap(StaticMap):
+    """
+    StaticMap that fetches tiles over a shared keep-alive session.
     
+    StaticMap already requests a view's tiles from a small thread pool, but
+    its default ``get`` opens a new connection (DNS + TLS) per tile. This
+    reuses pooled connections across tiles and renders, and serves tiles
+    shared by overlapping views from memory.
+    """
+    
+    def get(self, url, **kwargs):
+        headers = tuple(sorted((kwargs.get('headers') or {}).items()))
+        return 200, _fetch_tile(url, kwargs.get('timeout'), headers)
+
+
+@lru_cache(maxsize=8)
+def _render_background(
+    url: str,
+    width: int,
+    height: int,
+    zoom: int,
+    center_lng: float,
+    center_lat: float
+) -> Tuple[StaticMap, Image.Image]:
+    """
+    Render the tile background for a view, memoized on the exact view.
+    
+    Re-exporting a report for an unchanged view reuses the image instead of
+    fetching every tile again. Failed renders raise and are not cached.
+    
+    Args:
+        url: Tile URL template
+        width: Image width in pixels
+        height: Image height in pixels
+        zoom: Integer zoom level
+        center_lng: Center longitude
+        center_lat: Center latitude
+        
+    Returns:
+        Tuple of (rendered StaticMap, background image). Both are shared, so
+        callers must copy the image before drawing on it.
+    """
     # We MUST add at least one feature (even if dummy) or specify center/zoom to render
     # Since we draw manually, we'll just render with the calculated center/zoom.
-    # Ensure zoom is an integer for tile servers
-    zoom = int(zoom)
+    m = _PooledStaticMap(width, height, 20, url_template=url)
     image = m.render(zoom=zoom, center=(center_lng, center_lat))
-    draw = ImageDraw.Draw(image)
-
-    # Project coordinates to pixels and draw custom shapes
-    # Projection math from staticmap internals
-    def project(lat, lng):
-        x = (_lon_to_x(lng, zoom) - m.x_center) * m.tile_size + m.width / 2
-        y = (_lat_to_y(lat, zoom) - m.y_center) * m.tile_size + m.height / 2
-        return int(round(x)), int(round(y))
-
-    for c in cameras:
-        x, y = project(c['lat'], c['lng'])
-        # Green square for functioning, Black square for not functioning
-        color = '#28a745' if c['level'] == 'Functioning' else '#000000'
-        size = 14
-        half = size // 2
-        draw.rectangle([x - half, y - half, x + half, y + half], fill=color, outline="black", width=1)
+    return m, image
+
+
+def _marker_coords(markers: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extract marker coordinates as float arrays.
+    
+    Args:
+        markers: Marker dicts with 'lat' and 'lng'
         
-    for i in incidents:
-        x, y = project(i['lat'], i['lng'])
-        # Yellow, orange, red triangle for incidents (Low, Medium, Serious)
-        color = '#dc3545' if i['level'] == 'Serious' else '#fd7e14' if i['level'] == 'Medium' else '#ffc107'
-        size = 18
-        h = size // 2
-        points = [(x, y - h), (x - h, y + h), (x + h, y + h)]
-        draw.polygon(points, fill=color, outline="black", width=1)
+    Returns:
+        Tuple of (lats, lngs) arrays
+    """
+    lats = np.fromiter((mk['lat'] for mk in markers), dtype=np.float64, count=len(markers))
+    lngs = np.fromiter((mk['lng'] for mk in markers), dtype=np.float64, count=len(markers))
+    return lats, lngs
+
+
+def _project_to_pixels(
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    zoom: int,
+    m: StaticMap
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project marker coordinates to image pixels in one vectorized pass.
+    
+    Same Web Mercator math (including out-of-range wrapping) and
+    round-half-to-even as staticmap's _lon_to_x/_lat_to_y, applied to all
+    markers at once.
+    
+    Args:
+        lats: Marker latitudes
+        lngs: Marker longitudes
+        zoom: Integer zoom level the map was rendered at
+        m: The rendered StaticMap (provides center, tile size and image size)
         
-    return image
+    Returns:
+        Tuple of (x, y) integer pixel arrays
+    """
+    lngs = np.where((lngs < -180) | (lngs > 180), (lngs + 180) % 360 - 180, lngs)
+    lats = np.where((lats < -90) | (lats > 90), (lats + 90) % 180 - 90, lats)
+    
+    scale = 2.0 ** zoom
+    tile_x = (lngs + 180.0) / 360 * scale
+    lat_rad = lats * math.pi / 180
+    tile_y = (1 - np.log(np.tan(lat_rad) + 1 / np.cos(lat_rad)) / math.pi) / 2 * scale
+    
+    xs = (tile_x - m.x_center) * m.tile_size + m.width / 2
+    ys = (tile_y - m.y_center) * m.tile_size + m.height / 2
+    return np.rint(xs).astype(np.int64), np.rint(ys).astype(np.int64)
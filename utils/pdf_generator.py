@@ -1,62 +1,131 @@
 """
 PDF report generation utilities.
 """
+import hashlib
+import heapq
+import json
 import logging
+import multiprocessing
 import os
-import tempfile
+import queue
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import date
-from typing import Any, Dict, List
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for thread safety
-import matplotlib.pyplot as plt
+import numpy as np
 import requests
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
+from fpdf.fonts import FontFace
 
-from config import ASSETS_DIR, BANNER_PATH, APTOS_REGULAR, APTOS_BOLD, APTOS_ITALIC, APTOS_BOLD_ITALIC
-from utils.map_utils import generate_static_map
+from config import BANNER_PATH, APTOS_REGULAR, APTOS_BOLD, APTOS_ITALIC, APTOS_BOLD_ITALIC
+from utils.map_utils import encode_map_image, generate_static_map
 
 logger = logging.getLogger(__name__)
 
+# Background renders of report maps, started as soon as create_pdf is called
+_MAP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-map")
+MAP_PREFETCH_TIMEOUT = 60  # seconds; on timeout the report uses the schematic map
+
+# Brand font files present at startup, by style. Font files only change with
+# a redeploy, so they are probed once instead of on every report.
+_APTOS_FONT_FILES = {
+    style: path
+    for style, path in (
+        ('', APTOS_REGULAR),
+        ('B', APTOS_BOLD),
+        ('I', APTOS_ITALIC),
+        ('BI', APTOS_BOLD_ITALIC),
+    )
+    if path and os.path.exists(path)
+}
+_APTOS_AVAILABLE = '' in _APTOS_FONT_FILES and 'B' in _APTOS_FONT_FILES
+
+# Schematic-map figures kept for reuse across reports
+_FIGURE_POOL: "queue.LifoQueue[Tuple[Any, Any]]" = queue.LifoQueue(maxsize=2)
+
+# Schematic-map marker colors by level (unlisted levels use the fallback at the call site)
+_SCHEMATIC_CAMERA_COLORS = {'Functioning': '#28a745'}
+_SCHEMATIC_INCIDENT_COLORS = {'Serious': '#dc3545', 'Medium': '#fd7e14'}
+
+# Maximum number of incidents whose IDs are labelled on the schematic map
+_SCHEMATIC_LABEL_LIMIT = 50
+
+# Recently rendered static map JPEGs, keyed by a hash of everything the
+# render depends on (least recently used first)
+_MAP_CACHE_SIZE = 16
+_MAP_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_MAP_CACHE_LOCK = threading.Lock()
+
 
 class ReportPDF(FPDF):
     """Custom FPDF subclass for branded reports."""
     
-    def __init__(self, font_name="Arial", **kwargs):
+    def __init__(self, font_name="Helvetica", **kwargs):
         super().__init__(**kwargs)
         self.report_font = font_name
         self.registered_styles = {''}  # Default regular
         
-        # Auto-register fonts during initialization to ensure availability for footer
+        # Register the regular style up front (it is the fallback for every
+        # other style); the rest are loaded on first use by set_font
         if font_name == "Aptos":
-            self.add_font_safe('Aptos', '', APTOS_REGULAR)
-            self.add_font_safe('Aptos', 'B', APTOS_BOLD)
-            self.add_font_safe('Aptos', 'I', APTOS_ITALIC)
-            self.add_font_safe('Aptos', 'BI', APTOS_BOLD_ITALIC)
+            self._register_font('Aptos', '', _APTOS_FONT_FILES[''])
 
     def add_font_safe(self, family: str, style: str, file_path: str):
         """Add a font style only if the file exists."""
         if file_path and os.path.exists(file_path):
-            try:
-                self.add_font(family, style, file_path, uni=True)
-                self.registered_styles.add(style)
-            except Exception as e:
-                logger.error(f"Failed to register font {family} {style}: {e}")
+            self._register_font(family, style, file_path)
+
+    def _register_font(self, family: str, style: str, file_path: str):
+        """Add a font style from a file known to exist, logging failures."""
+        try:
+            self.add_font(family, style, file_path)
+            self.registered_styles.add(style)
+        except Exception as e:
+            logger.error(f"Failed to register font {family} {style}: {e}")
+
+    def set_font(self, family=None, style='', size=0):
+        """Set the font, first loading a brand font style that is not yet registered."""
+        if family == "Aptos" and self.report_font == "Aptos":
+            self._ensure_style((style or '').upper())
+        super().set_font(family, style, size)
+
+    def _ensure_style(self, style: str):
+        """Register a brand font style on first use, if its file exists."""
+        if style not in self.registered_styles and style in _APTOS_FONT_FILES:
+            self._register_font('Aptos', style, _APTOS_FONT_FILES[style])
 
     def set_font_safe(self, style: str = '', size: float = 0):
-        """Set font with a safe fallback to regular or Arial if style is missing."""
+        """Set font with a safe fallback to regular or Helvetica if style is missing."""
+        if self.report_font == "Aptos":
+            self._ensure_style(style)
+        
         # Use registered style if available, otherwise fall back to regular
         target_style = style if style in self.registered_styles else ''
         
+        # Nothing to do if that font is already active (read from fpdf2's own
+        # state, so changes made through plain set_font are accounted for)
+        if (
+            self.font_family == self.report_font.lower()
+            and self.font_style == target_style
+            and (not size or self.font_size_pt == size)
+        ):
+            return
+        
         try:
             self.set_font(self.report_font, target_style, size)
         except Exception:
-            # Absolute fallback to standard Arial
+            # Absolute fallback to the standard Helvetica core font
             try:
                 fallback_style = style if style in ['', 'B', 'I', 'BI'] else ''
-                self.set_font('Arial', fallback_style, size)
+                self.set_font('Helvetica', fallback_style, size)
             except Exception:
-                self.set_font('Arial', '', size)
+                self.set_font('Helvetica', '', size)
 
     def header(self):
         """No header on content pages."""
@@ -73,7 +142,7 @@ class ReportPDF(FPDF):
             f"© {current_year} Boardwalk Investments Group. Proprietary & Confidential. "
             "Internal use only. Unauthorized reproduction or distribution is strictly prohibited."
         )
-        self.cell(0, 8, footer_text, align='C', ln=True)
+        self.cell(0, 8, footer_text, align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         # Page Number Row
         self.set_y(-10)
@@ -86,41 +155,102 @@ def create_pdf(
     incidents: List[Dict[str, Any]],
     project_title: str = "",
     map_tile_url: str = None,
-    existing_map_image: bytes = None
-) -> bytes:
+    existing_map_image: bytes = None,
+    output_stream: Optional[BinaryIO] = None,
+    compress: bool = True
+) -> Optional[bytes]:
     """
-    Generate PDF report. Tries to use brand fonts, falls back to Arial on error.
+    Generate PDF report. Tries to use brand fonts, falls back to Helvetica on error.
+    
+    If output_stream is given, the document is written to it straight from
+    fpdf2's buffer and None is returned; otherwise the PDF bytes are returned.
+    Passing compress=False skips deflating the page content streams, which
+    builds quick previews faster at the cost of a larger file.
     """
     # Determine preferred font
-    preferred_font = "Arial"
-    if os.path.exists(APTOS_REGULAR) and os.path.exists(APTOS_BOLD):
-        preferred_font = "Aptos"
+    preferred_font = "Aptos" if _APTOS_AVAILABLE else "Helvetica"
+    
+    # Start fetching the map now so the tile downloads overlap with building
+    # the title page; the map page waits on the result
+    map_future = None
+    if incidents and not existing_map_image:
+        cameras, incident_list = _split_markers(incidents)
+        map_future = _MAP_EXECUTOR.submit(
+            _cached_static_map, incident_list, cameras,
+            project_data.get('map_config'), map_tile_url
+        )
         
     try:
         return _build_pdf(
             project_data, incidents, project_title, 
-            map_tile_url, existing_map_image, font_name=preferred_font
+            map_tile_url, existing_map_image, font_name=preferred_font,
+            map_future=map_future, output_stream=output_stream, compress=compress
         )
     except Exception as e:
-        logger.error(f"PDF generation failed with font {preferred_font}: {e}. Falling back to Arial.")
-        if preferred_font != "Arial":
+        logger.error(f"PDF generation failed with font {preferred_font}: {e}. Falling back to Helvetica.")
+        if preferred_font != "Helvetica":
             return _build_pdf(
                 project_data, incidents, project_title,
-                map_tile_url, existing_map_image, font_name="Arial"
+                map_tile_url, existing_map_image, font_name="Helvetica",
+                map_future=map_future, output_stream=output_stream, compress=compress
             )
         raise e
 
 
+def create_pdfs_batch(
+    report_requests: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[bytes]:
+    """
+    Generate several PDF reports in parallel worker processes.
+    
+    Report building is CPU-bound (layout, font subsetting, image encoding),
+    so separate processes scale with the number of cores where threads would
+    contend for the GIL.
+    
+    Args:
+        report_requests: Keyword arguments for create_pdf, one dict per report
+            (output_stream is not supported here)
+        max_workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        PDF bytes for each request, in request order
+    """
+    if not report_requests:
+        return []
+    if len(report_requests) == 1:
+        return [create_pdf(**report_requests[0])]
+    
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(report_requests) // (4 * workers))
+    # Spawned rather than forked: a forked worker would inherit
+    # _MAP_EXECUTOR's bookkeeping without its threads, and its map prefetch
+    # would never run
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return list(pool.map(_create_pdf_from_kwargs, report_requests, chunksize=chunksize))
+
+
+def _create_pdf_from_kwargs(kwargs: Dict[str, Any]) -> bytes:
+    """Process-pool entry point for create_pdfs_batch."""
+    return create_pdf(**kwargs)
+
+
 def _build_pdf(
     project_data: Dict[str, Any],
     incidents: List[Dict[str, Any]],
     project_title: str = "",
     map_tile_url: str = None,
     existing_map_image: bytes = None,
-    font_name: str = "Arial"
-) -> bytes:
+    font_name: str = "Helvetica",
+    map_future: Future = None,
+    output_stream: Optional[BinaryIO] = None,
+    compress: bool = True
+) -> Optional[bytes]:
     """Internal function to build the PDF with a specific font."""
     pdf = ReportPDF(font_name=font_name)
+    pdf.set_compression(compress)
     
     # === TITLE PAGE ===
     pdf.add_page()
@@ -130,23 +260,21 @@ def _build_pdf(
     pdf.set_y(150)
     pdf.set_font_safe('B', 28)
     prop_name = project_data.get('property', project_data.get('name', 'Property'))
-    pdf.cell(0, 20, prop_name, ln=True, align='C')
+    pdf.cell(0, 20, prop_name, align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     
     pdf.set_font_safe('', 16)
     year_val = project_data.get('year', str(date.today().year))
-    pdf.cell(0, 10, f"{year_val} - Incidents & Claims Map", ln=True, align='C')
+    pdf.cell(0, 10, f"{year_val} - Incidents & Claims Map", align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     
     pdf.ln(10)
     pdf.set_font_safe('', 12)
-    pdf.cell(0, 10, f"Date: {date.today().strftime('%B %d, %Y')}", ln=True, align='C')
+    pdf.cell(0, 10, f"Date: {date.today().strftime('%B %d, %Y')}", align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     
     if project_data.get('author'):
         pdf.ln(5)
-        pdf.cell(0, 10, f"Prepared by: {project_data['author']}", ln=True, align='C')
+        pdf.cell(0, 10, f"Prepared by: {project_data['author']}", align='C', new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
-    # Separate cameras and incidents
-    cameras = [i for i in incidents if i.get('type') == 'Camera']
-    incident_list = [i for i in incidents if i.get('type') == 'Incident']
+    cameras, incident_list = _split_markers(incidents)
 
     # === CONTENT PAGES ===
     # Start first content page (Map)
@@ -159,7 +287,8 @@ def _build_pdf(
         pdf, font_name, incidents, cameras, 
         incident_list, project_data.get('map_config'),
         map_tile_url=map_tile_url,
-        existing_map_image=existing_map_image
+        existing_map_image=existing_map_image,
+        map_future=map_future
     )
     pdf.ln(8)
     
@@ -177,7 +306,23 @@ def _build_pdf(
     _add_section_header(pdf, font_name, "Incident Details")
     _add_incident_table(pdf, font_name, incident_list)
     
-    return pdf.output(dest='S').encode('latin-1')
+    buffer = pdf.output()
+    if output_stream is not None:
+        output_stream.write(buffer)
+        return None
+    return bytes(buffer)
+
+
+def _split_markers(incidents: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]:
+    """Separate cameras and incidents in one pass, keeping list order."""
+    cameras, incident_list = [], []
+    for rec in incidents:
+        rec_type = rec.get('type')
+        if rec_type == 'Camera':
+            cameras.append(rec)
+        elif rec_type == 'Incident':
+            incident_list.append(rec)
+    return cameras, incident_list
 
 
 def _add_section_header(pdf: FPDF, font_name: str, title: str) -> None:
@@ -185,7 +330,7 @@ def _add_section_header(pdf: FPDF, font_name: str, title: str) -> None:
     pdf.set_font(font_name, 'B', 14)
     pdf.set_fill_color(50, 50, 50)
     pdf.set_text_color(255, 255, 255)
-    pdf.cell(0, 10, f"  {title}", ln=True, fill=True)
+    pdf.cell(0, 10, f"  {title}", fill=True, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     pdf.set_text_color(0, 0, 0)
     pdf.ln(2)
 
@@ -198,40 +343,29 @@ def _add_location_map(
     incident_list: List[Dict],
     map_config: Dict = None,
     map_tile_url: str = None,
-    existing_map_image: bytes = None
+    existing_map_image: bytes = None,
+    map_future: Future = None
 ) -> None:
     """Add a real map snapshot to the PDF using Static Maps API."""
     if not incidents:
         pdf.set_font(font_name, '', 10)
-        pdf.cell(0, 10, "No markers to display.", ln=True)
+        pdf.cell(0, 10, "No markers to display.", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         return
 
     # Attempt to fetch high-res static map snapshot
     try:
         if existing_map_image:
-            # Use pre-generated image
-            # We need to save it to a temp file for FPDF
-            image = None # Placeholder so we don't trip up the save logic below if we were reusing it
-            
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-                tmp_file.write(existing_map_image)
-                tmp_file_path = tmp_file.name
-                
-            pdf.image(tmp_file_path, x=10, w=190)
-            os.unlink(tmp_file_path)
+            # Use pre-generated image; fpdf2 reads it straight from memory
+            pdf.image(BytesIO(existing_map_image), x=10, w=190)
             
+        elif map_future is not None:
+            # Rendered in the background since create_pdf started
+            pdf.image(BytesIO(map_future.result(timeout=MAP_PREFETCH_TIMEOUT)), x=10, w=190)
         else:
-            image = generate_static_map(
-                incidents=incident_list,
-                cameras=cameras,
-                map_config=map_config,
-                url=map_tile_url
+            pdf.image(
+                BytesIO(_cached_static_map(incident_list, cameras, map_config, map_tile_url)),
+                x=10, w=190
             )
-
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-                image.save(tmp_file.name)
-                pdf.image(tmp_file.name, x=10, w=190)
-                os.unlink(tmp_file.name)
         
         # Add Interactive Portal Note
 
@@ -244,105 +378,268 @@ def _add_location_map(
 
     # --- FALLBACK: Schematic Map (Matplotlib) ---
     try:
-        with plt.ioff():
-            fig_map, ax_map = plt.subplots(figsize=(10, 6))
-            # ... (the rest of the matplotlib logic)
+        with _pooled_figure() as (fig_map, ax_map):
             fig_map.patch.set_facecolor('#f0f0f0')
             ax_map.set_facecolor('#e8e8e8')
             
-            # Simple scatter plot logic merged here
-            for c in cameras:
-                color = '#28a745' if c['level'] == 'Functioning' else '#6c757d'
-                ax_map.scatter(c['lng'], c['lat'], c=color, s=100, marker='s', edgecolors='black')
+            # One scatter call (one collection) per marker category
+            if cameras:
+                cam_lng, cam_lat = _lng_lat_arrays(cameras)
+                cam_colors = [_SCHEMATIC_CAMERA_COLORS.get(c['level'], '#6c757d') for c in cameras]
+                ax_map.scatter(cam_lng, cam_lat, c=cam_colors, s=100, marker='s', edgecolors='black')
                 
-            for i in incident_list:
-                color = '#dc3545' if i['level'] == 'Serious' else '#fd7e14' if i['level'] == 'Medium' else '#28a745'
-                ax_map.scatter(i['lng'], i['lat'], c=color, s=120, edgecolors='black')
-                ax_map.annotate(str(i['id']), (i['lng'], i['lat']), fontsize=7, ha='center', xytext=(0, 5), textcoords='offset points')
+            if incident_list:
+                inc_lng, inc_lat = _lng_lat_arrays(incident_list)
+                inc_colors = [_SCHEMATIC_INCIDENT_COLORS.get(i['level'], '#28a745') for i in incident_list]
+                ax_map.scatter(inc_lng, inc_lat, c=inc_colors, s=120, edgecolors='black')
+                # ID labels become an unreadable pile past a few dozen markers,
+                # so they are only drawn for small maps
+                if len(incident_list) <= _SCHEMATIC_LABEL_LIMIT:
+                    for i, x, y in zip(incident_list, inc_lng.tolist(), inc_lat.tolist()):
+                        ax_map.annotate(str(i['id']), (x, y), fontsize=7, ha='center', xytext=(0, 5), textcoords='offset points')
             
             ax_map.set_xlabel("Longitude")
             ax_map.set_ylabel("Latitude")
             ax_map.grid(True, alpha=0.3)
             ax_map.set_title("Property Overview (Schematic)")
             
-            plt.tight_layout()
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-                fig_map.savefig(tmp_file.name, dpi=120)
-                pdf.image(tmp_file.name, x=10, w=190)
-                os.unlink(tmp_file.name)
-            plt.close(fig_map)
+            fig_map.tight_layout()
+            buf = BytesIO()
+            fig_map.savefig(buf, format='png', dpi=120)
+            buf.seek(0)
+            pdf.image(buf, x=10, w=190)
     except Exception as e:
         pdf.set_font_safe('', 10)
-        pdf.cell(0, 10, "[Map Generation Error - No details available]", ln=True)
+        pdf.cell(0, 10, "[Map Generation Error - No details available]", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+
+def _lng_lat_arrays(markers: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return marker longitudes and latitudes as float arrays."""
+    lngs = np.fromiter((m['lng'] for m in markers), dtype=np.float64, count=len(markers))
+    lats = np.fromiter((m['lat'] for m in markers), dtype=np.float64, count=len(markers))
+    return lngs, lats
+
+
+@lru_cache(maxsize=1)
+def _matplotlib_classes() -> Tuple[type, type]:
+    """
+    Import matplotlib on first use of the schematic fallback.
+    
+    The static map almost always succeeds, so report workers normally never
+    pay matplotlib's import time and memory.
+    
+    Returns:
+        Tuple of (Figure, FigureCanvasAgg) classes
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    return Figure, FigureCanvasAgg
+
+
+@contextmanager
+def _pooled_figure() -> Iterator[Tuple[Any, Any]]:
+    """
+    Borrow a 10x6 figure and its axes for the schematic map.
+    
+    Figures are built with the object-oriented API (no pyplot registry holds
+    on to them) and returned to a small pool afterwards, so repeated reports
+    reuse one Figure/Axes pair instead of constructing and closing one each
+    time. Borrowed axes are cleared before use.
+    """
+    try:
+        fig, ax = _FIGURE_POOL.get_nowait()
+        ax.clear()
+    except queue.Empty:
+        figure_cls, canvas_cls = _matplotlib_classes()
+        fig = figure_cls(figsize=(10, 6))
+        canvas_cls(fig)
+        ax = fig.add_subplot()
+    try:
+        yield fig, ax
+    finally:
+        try:
+            _FIGURE_POOL.put_nowait((fig, ax))
+        except queue.Full:
+            pass
+
+
+def _map_cache_key(
+    incident_list: List[Dict],
+    cameras: List[Dict],
+    map_config: Dict = None,
+    map_tile_url: str = None
+) -> str:
+    """
+    Hash the inputs that determine a static map render.
+    
+    Markers keep their list order, since later markers are drawn on top.
+    
+    Returns:
+        Hex digest used as the cache file name
+    """
+    payload = json.dumps(
+        [
+            map_tile_url,
+            map_config,
+            [(m.get('id'), m['lat'], m['lng'], m['level']) for m in incident_list],
+            [(m.get('id'), m['lat'], m['lng'], m['level']) for m in cameras],
+        ],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _cached_static_map(
+    incident_list: List[Dict],
+    cameras: List[Dict],
+    map_config: Dict = None,
+    map_tile_url: str = None
+) -> bytes:
+    """
+    Return a rendered static map as JPEG bytes, rendering it on a cache miss.
+    
+    Repeat reports for an unchanged map skip the tile downloads entirely.
+    The cache is in memory and holds the most recent _MAP_CACHE_SIZE maps.
+    
+    Args:
+        incident_list: Incident markers
+        cameras: Camera markers
+        map_config: Map center/zoom configuration
+        map_tile_url: Tile URL template
+        
+    Returns:
+        JPEG bytes
+    """
+    key = _map_cache_key(incident_list, cameras, map_config, map_tile_url)
+    with _MAP_CACHE_LOCK:
+        cached = _MAP_CACHE.get(key)
+        if cached is not None:
+            _MAP_CACHE.move_to_end(key)
+            logger.debug(f"Static map cache hit: {key}")
+            return cached
+    
+    image = generate_static_map(
+        incidents=incident_list,
+        cameras=cameras,
+        map_config=map_config,
+        url=map_tile_url
+    )
+    map_bytes = encode_map_image(image)
+    
+    with _MAP_CACHE_LOCK:
+        _MAP_CACHE[key] = map_bytes
+        _MAP_CACHE.move_to_end(key)
+        while len(_MAP_CACHE) > _MAP_CACHE_SIZE:
+            _MAP_CACHE.popitem(last=False)
+    return map_bytes
 
 
 def _add_camera_stats(pdf: FPDF, font_name: str, cameras: List[Dict]) -> None:
     """Add camera statistics section to the PDF."""
     total_cameras = len(cameras)
-    functioning = len([c for c in cameras if c['level'] == 'Functioning'])
-    dysfunctioning = len([c for c in cameras if c['level'] == 'Not Functioning'])
+    level_counts = Counter(c['level'] for c in cameras)
+    functioning = level_counts['Functioning']
+    dysfunctioning = level_counts['Not Functioning']
     
     pdf.set_font_safe('', 10)
-    pdf.cell(60, 8, f"Total Cameras: {total_cameras}", ln=False)
-    pdf.cell(60, 8, f"Functioning: {functioning}", ln=False)
-    pdf.cell(60, 8, f"Dysfunctioning: {dysfunctioning}", ln=True)
+    _add_stat_row(pdf, 60, (
+        f"Total Cameras: {total_cameras}",
+        f"Functioning: {functioning}",
+        f"Dysfunctioning: {dysfunctioning}",
+    ))
+
+
+def _add_stat_row(pdf: FPDF, cell_width: float, texts: Tuple[str, ...]) -> None:
+    """Add one row of equal-width statistic cells and move to the next line."""
+    for text in texts[:-1]:
+        pdf.cell(cell_width, 8, text)
+    pdf.cell(cell_width, 8, texts[-1], new_x=XPos.LMARGIN, new_y=YPos.NEXT)
 
 
 def _add_incident_stats(pdf: FPDF, font_name: str, incident_list: List[Dict]) -> None:
     """Add incident statistics section to the PDF."""
     total_claims = len(incident_list)
     total_comp = sum(i.get('compensation', 0) for i in incident_list)
-    serious_count = len([i for i in incident_list if i['level'] == 'Serious'])
-    medium_count = len([i for i in incident_list if i['level'] == 'Medium'])
-    light_count = len([i for i in incident_list if i['level'] == 'Light'])
+    level_counts = Counter(i['level'] for i in incident_list)
+    serious_count = level_counts['Serious']
+    medium_count = level_counts['Medium']
+    light_count = level_counts['Light']
     
     pdf.set_font_safe('', 10)
-    pdf.cell(95, 8, f"Total Claims: {total_claims}", ln=False)
-    pdf.cell(95, 8, f"Total Compensation: ${total_comp:,.2f}", ln=True)
-    pdf.cell(60, 8, f"Serious: {serious_count}", ln=False)
-    pdf.cell(60, 8, f"Medium: {medium_count}", ln=False)
-    pdf.cell(60, 8, f"Light: {light_count}", ln=True)
+    _add_stat_row(pdf, 95, (
+        f"Total Claims: {total_claims}",
+        f"Total Compensation: ${total_comp:,.2f}",
+    ))
+    _add_stat_row(pdf, 60, (
+        f"Serious: {serious_count}",
+        f"Medium: {medium_count}",
+        f"Light: {light_count}",
+    ))
     
     # Top 5 by Compensation
     if incident_list:
         pdf.ln(3)
         pdf.set_font_safe('B', 10)
-        pdf.cell(0, 8, "Top 5 Claims by Compensation:", ln=True)
-        sorted_inc = sorted(incident_list, key=lambda x: x.get('compensation', 0), reverse=True)[:5]
+        pdf.cell(0, 8, "Top 5 Claims by Compensation:", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        sorted_inc = heapq.nlargest(5, incident_list, key=lambda x: x.get('compensation', 0))
         pdf.set_font_safe('', 9)
-        for idx, inc in enumerate(sorted_inc, 1):
-            pdf.cell(
-                0, 6,
-                f"  {idx}. {inc['id']} - {inc.get('description', 'N/A')} - ${inc.get('compensation', 0):,.2f}",
-                ln=True
-            )
+        # One text block for all five lines
+        pdf.multi_cell(
+            0, 6,
+            "\n".join(
+                f"  {idx}. {inc['id']} - {inc.get('description', 'N/A')} - ${inc.get('compensation', 0):,.2f}"
+                for idx, inc in enumerate(sorted_inc, 1)
+            ),
+            new_x=XPos.LMARGIN, new_y=YPos.NEXT
+        )
 
 
 def _add_incident_table(pdf: FPDF, font_name: str, incident_list: List[Dict]) -> None:
     """Add incident details table to the PDF."""
     if not incident_list:
         pdf.set_font_safe('', 10)
-        pdf.cell(0, 10, "No incidents recorded.", ln=True)
+        pdf.cell(0, 10, "No incidents recorded.", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         return
     
-    # Table header - BLACK background, WHITE text
-    pdf.set_fill_color(0, 0, 0)
-    pdf.set_text_color(255, 255, 255)
-    pdf.set_font_safe('B', 9)
-    pdf.cell(15, 8, "ID", 1, 0, 'C', fill=True)
-    pdf.cell(20, 8, "Level", 1, 0, 'C', fill=True)
-    pdf.cell(25, 8, "Date", 1, 0, 'C', fill=True)
-    pdf.cell(30, 8, "Comp ($)", 1, 0, 'C', fill=True)
-    pdf.cell(100, 8, "Incident Type", 1, 1, 'C', fill=True)
-    
-    # Table rows
+    # Table header - BLACK background, WHITE text, bold; repeated on every page
     pdf.set_text_color(0, 0, 0)
     pdf.set_font_safe('', 8)
+    with pdf.table(
+        width=190,
+        col_widths=(15, 20, 25, 30, 100),
+        text_align=("CENTER", "CENTER", "CENTER", "RIGHT", "LEFT"),
+        headings_style=FontFace(emphasis="BOLD", color=255, fill_color=0, size_pt=9),
+        line_height=7,
+    ) as table:
+        headings = table.row()
+        for heading in ("ID", "Level", "Date", "Comp ($)", "Incident Type"):
+            headings.cell(heading, align="CENTER")
+        
+        # Table rows
+        for row in _format_incident_rows(incident_list):
+            table.row(row)
+
+
+def _format_incident_rows(incident_list: List[Dict]) -> List[Tuple[str, str, str, str, str]]:
+    """
+    Format every incident table row up front.
     
-    for inc in incident_list:
-        pdf.cell(15, 7, str(inc.get('id', '?')), 1, 0, 'C')
-        pdf.cell(20, 7, str(inc.get('level', '')), 1, 0, 'C')
-        pdf.cell(25, 7, str(inc.get('date', ''))[:10], 1, 0, 'C')
-        pdf.cell(30, 7, f"${inc.get('compensation', 0):,.2f}", 1, 0, 'R')
-        desc = str(inc.get('description', ''))
-        pdf.cell(100, 7, desc[:50] + "..." if len(desc) > 50 else desc, 1, 1, 'L')
+    Returns:
+        One (id, level, date, compensation, description) tuple of display
+        strings per incident, in list order
+    """
+    return list(map(_format_incident_row, incident_list))
+
+
+def _format_incident_row(inc: Dict) -> Tuple[str, str, str, str, str]:
+    """Format one incident as its table cells."""
+    get = inc.get
+    desc = str(get('description', ''))
+    return (
+        str(get('id', '?')),
+        str(get('level', '')),
+        str(get('date', ''))[:10],
+        f"${get('compensation', 0):,.2f}",
+        desc[:50] + "..." if len(desc) > 50 else desc,
+    )